@@ -1,32 +1,57 @@
 #!/usr/bin/env python3
 import argparse
-import requests
+import asyncio
+import aiohttp
 import os
 import pandas as pd
+import numpy as np
 from tqdm import tqdm
 import time
-import json
+import math
+import orjson
+import hashlib
+from collections import OrderedDict, deque
 from pathlib import Path
+import matplotlib
+# Backend non-GUI: plot hanya disimpan ke file, tidak perlu probing backend GUI
+matplotlib.use('Agg')
 import matplotlib.pyplot as plt
 import seaborn as sns
-from datetime import datetime, timezone
+from datetime import datetime, timezone, timedelta
 import logging
-from typing import List, Dict, Any, Optional, Callable
+from typing import List, Dict, Any, Optional, Callable, Tuple
 import re
+import ciso8601
 import colorama
 from colorama import Fore, Style
-from tqdm.auto import tqdm
 import sys
 import signal
-import urllib3
 import warnings
 import urllib.parse
+import email.utils
 import subprocess
 import zipfile
-import shutil
+import sqlite3
+try:
+    # Opsional: akses object git langsung lewat libgit2, tanpa subprocess
+    import pygit2
+except ImportError:
+    pygit2 = None
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
-# Suppress SSL warnings
-urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+# Maksimal request GitLab API yang berjalan bersamaan; jika kena rate limit, 429 di-retry sesuai Retry-After
+MAX_CONCURRENCY = 20
+# Jumlah halaman list yang di-prefetch bersamaan saat total halaman tidak diketahui
+PREFETCH_PAGES = 10
+# Maksimal retry untuk HTTP 429/5xx dari GitLab API
+MAX_RETRIES = 5
+# Umur maksimal entry cache GitLab API (detik), supaya state MR yang berubah ikut ter-refresh
+CACHE_TTL = 86400
+# Jumlah entry cache yang juga disimpan di memori (LRU) agar tidak di-parse ulang dari SQLite
+MEM_CACHE_SIZE = 1024
+# Jumlah thread untuk stat file snapshot (stat melepas GIL; di NFS/FUSE latensi stat dominan)
+STAT_WORKERS = min(32, (os.cpu_count() or 1) * 4)
 
 # Setup logging
 logging.basicConfig(
@@ -38,9 +63,16 @@ logger = logging.getLogger(__name__)
 # Initialize colorama
 colorama.init()
 
+# Escape warna dan pesan yang sering dipakai, dibangun sekali saat module load
+YELLOW = Fore.YELLOW
+RED = Fore.RED
+RESET = Style.RESET_ALL
+CANCELLED_MESSAGE = f"\n{YELLOW}⚠️ Proses dibatalkan oleh user{RESET}"
+DATA_SAVED_MESSAGE = f"{YELLOW}ℹ️ Data yang sudah diproses akan disimpan{RESET}"
+
 def signal_handler(signum, frame):
-    print(f"\n{Fore.YELLOW}⚠️ Proses dibatalkan oleh user{Style.RESET_ALL}")
-    print(f"{Fore.YELLOW}ℹ️ Data yang sudah diproses akan disimpan{Style.RESET_ALL}")
+    print(CANCELLED_MESSAGE)
+    print(DATA_SAVED_MESSAGE)
     sys.exit(0)
 
 # Register signal handler
@@ -50,7 +82,7 @@ signal.signal(signal.SIGINT, signal_handler)
 class ColoredFormatter(logging.Formatter):
     def format(self, record):
         if record.levelno >= logging.ERROR:
-            record.msg = f"{Fore.RED}{record.msg}{Style.RESET_ALL}"
+            record.msg = f"{RED}{record.msg}{RESET}"
         return super().format(record)
 
 # Set formatter
@@ -70,108 +102,342 @@ class ErrorCollector:
     
     def print_errors(self):
         if self.errors:
-            print(f"\n{Fore.RED}=== Error Summary ==={Style.RESET_ALL}")
+            print(f"\n{RED}=== Error Summary ==={RESET}")
             for i, error in enumerate(self.errors, 1):
-                print(f"{Fore.RED}{i}. {error}{Style.RESET_ALL}")
-            print(f"{Fore.RED}==================={Style.RESET_ALL}\n")
+                print(f"{RED}{i}. {error}{RESET}")
+            print(f"{RED}==================={RESET}\n")
+
+class CacheDB:
+    """Cache response GitLab API di satu file SQLite (pengganti satu file JSON per request)"""
+    def __init__(self, db_path: str = '.gitlab_cache.db', ttl: int = CACHE_TTL):
+        self.ttl = ttl
+        self.conn = sqlite3.connect(db_path, isolation_level=None)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA busy_timeout=5000")
+        self.conn.execute("CREATE TABLE IF NOT EXISTS cache(key TEXT PRIMARY KEY, body BLOB, ts INTEGER, etag TEXT)")
+        # Cache lama dibuat sebelum ada kolom etag
+        columns = {row[1] for row in self.conn.execute("PRAGMA table_info(cache)")}
+        if 'etag' not in columns:
+            self.conn.execute("ALTER TABLE cache ADD COLUMN etag TEXT")
+        # Buang entry kedaluwarsa sekali saat dibuka; yang punya ETag disimpan untuk revalidasi (304)
+        self.conn.execute("DELETE FROM cache WHERE ts < ? AND etag IS NULL", (int(time.time()) - self.ttl,))
+    
+    def get(self, key: str) -> Optional[bytes]:
+        row = self.conn.execute(
+            "SELECT body FROM cache WHERE key=? AND ts >= ?", (key, int(time.time()) - self.ttl)
+        ).fetchone()
+        return row[0] if row else None
+    
+    def get_stale(self, key: str) -> Tuple[Optional[bytes], Optional[str]]:
+        """Body dan ETag tanpa melihat umur entry, untuk conditional GET"""
+        row = self.conn.execute("SELECT body, etag FROM cache WHERE key=?", (key,)).fetchone()
+        return (row[0], row[1]) if row else (None, None)
+    
+    def set(self, key: str, body: bytes, etag: Optional[str] = None):
+        self.conn.execute(
+            "INSERT OR REPLACE INTO cache(key, body, ts, etag) VALUES (?, ?, ?, ?)",
+            (key, body, int(time.time()), etag)
+        )
+    
+    def close(self):
+        self.conn.close()
 
 class GitLabAPI:
-    def __init__(self, gitlab_url: str, token: str, project_id: str, verify_ssl: bool = True):
+    def __init__(self, gitlab_url: str, token: str, project_id: str, verify_ssl: bool = True,
+                 concurrency: int = MAX_CONCURRENCY, repo_path: Optional[str] = None):
         self.api_url = gitlab_url.rstrip('/') + '/api/v4'
         self.headers = {'PRIVATE-TOKEN': token}
         self.project_id = project_id
-        self.cache_dir = Path('.gitlab_cache')
-        self.cache_dir.mkdir(exist_ok=True)
+        self.cache = CacheDB()
+        self.mem_cache: OrderedDict = OrderedDict()
         self.verify_ssl = verify_ssl
+        self.concurrency = concurrency
+        self.session: Optional[aiohttp.ClientSession] = None
+        self.semaphore: Optional[asyncio.Semaphore] = None
+        # Clone lokal (opsional) untuk membaca ukuran file tanpa request API
+        self.repo_path = repo_path
+        self.batcher: Optional[GitBatcher] = None
         self.error_collector = ErrorCollector()
+
+    async def __aenter__(self):
+        # Satu pool koneksi keep-alive untuk semua request; koneksi idle dipertahankan melewati
+        # jeda retry/rate limit, dan resolusi DNS host GitLab di-cache selama run
+        connector = aiohttp.TCPConnector(
+            limit=self.concurrency, ssl=self.verify_ssl,
+            keepalive_timeout=60, ttl_dns_cache=300
+        )
+        self.session = aiohttp.ClientSession(connector=connector, headers=self.headers)
+        # Semaphore membatasi request yang berjalan bersamaan (pengganti time.sleep)
+        self.semaphore = asyncio.Semaphore(self.concurrency)
+        if self.repo_path:
+            self.batcher = GitBatcher(self.repo_path)
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.session.close()
+        self.session = None
+        self.cache.close()
+        if self.batcher:
+            self.batcher.close()
+            self.batcher = None
+
+    async def _request(self, url: str, params: Optional[Dict] = None, method: str = 'GET',
+                       headers: Optional[Dict] = None) -> Tuple[Any, Any]:
+        """Request ke GitLab API, kembalikan body JSON (None untuk HEAD dan 304) dan response headers.
+
+        HTTP 429 di-retry setelah waktu RateLimit-Reset, HTTP 5xx di-retry dengan
+        exponential backoff (maksimal MAX_RETRIES kali).
+        """
+        for attempt in range(MAX_RETRIES + 1):
+            async with self.semaphore:
+                async with self.session.request(method, url, params=params, headers=headers) as r:
+                    retryable = r.status == 429 or r.status >= 500
+                    if not retryable or attempt == MAX_RETRIES:
+                        r.raise_for_status()
+                        # 304 Not Modified tidak punya body
+                        data = orjson.loads(await r.read()) if method != 'HEAD' and r.status != 304 else None
+                        response_headers = r.headers
+                        break
+                    if r.status == 429:
+                        delay = self._rate_limit_delay(r.headers, attempt)
+                    else:
+                        delay = 2 ** attempt
+            logger.warning(f"HTTP {r.status} dari {url}, retry {attempt + 1}/{MAX_RETRIES} dalam {delay:.0f}s")
+            await asyncio.sleep(delay)
         
-    def _get_cache_path(self, endpoint: str, params: Dict) -> Path:
-        cache_key = f"{endpoint}_{hash(json.dumps(params, sort_keys=True))}.json"
-        return self.cache_dir / cache_key
+        # Hampir mencapai rate limit, perlambat sedikit sebelum request berikutnya
+        remaining = response_headers.get('RateLimit-Remaining')
+        if remaining is not None and int(remaining) < 5:
+            await asyncio.sleep(1)
+        return data, response_headers
+
+    @staticmethod
+    def _rate_limit_delay(headers, attempt: int) -> float:
+        """Hitung lama tunggu setelah HTTP 429 dari header RateLimit-Reset/Retry-After"""
+        reset = headers.get('RateLimit-Reset')
+        if reset and reset.isdigit():
+            return max(1, int(reset) - time.time())
+        retry_after = headers.get('Retry-After')
+        if retry_after:
+            # Retry-After bisa berupa detik atau HTTP-date (RFC 9110)
+            if retry_after.isdigit():
+                return max(1, int(retry_after))
+            try:
+                retry_at = email.utils.parsedate_to_datetime(retry_after)
+            except (TypeError, ValueError):
+                retry_at = None
+            if retry_at is not None:
+                if retry_at.tzinfo is None:
+                    retry_at = retry_at.replace(tzinfo=timezone.utc)
+                return max(1, retry_at.timestamp() - time.time())
+        # Header tidak ada atau tidak bisa dibaca: exponential backoff
+        return 2 ** attempt
+
+    async def _get_json(self, url: str, params: Optional[Dict] = None) -> Any:
+        """GET ke GitLab API dan kembalikan body JSON"""
+        data, _ = await self._request(url, params=params)
+        return data
+
+    def _get_cache_key(self, endpoint: str, params: Dict) -> str:
+        # hash() bawaan Python diacak per proses, jadi pakai digest yang stabil antar run
+        canonical = orjson.dumps(params, option=orjson.OPT_SORT_KEYS)
+        return f"{endpoint}_{hashlib.blake2b(canonical, digest_size=16).hexdigest()}"
     
-    def _get_cached_data(self, cache_path: Path) -> Optional[List[Dict]]:
-        if cache_path.exists():
-            with open(cache_path, 'r') as f:
-                return json.load(f)
+    def _get_cached_data(self, cache_key: str) -> Optional[List[Dict]]:
+        if cache_key in self.mem_cache:
+            self.mem_cache.move_to_end(cache_key)
+            return self.mem_cache[cache_key]
+        body = self.cache.get(cache_key)
+        if body is not None:
+            data = orjson.loads(body)
+            self._remember(cache_key, data)
+            return data
         return None
     
-    def _save_to_cache(self, cache_path: Path, data: List[Dict]):
-        with open(cache_path, 'w') as f:
-            json.dump(data, f)
+    def _save_to_cache(self, cache_key: str, data: List[Dict]):
+        self.cache.set(cache_key, orjson.dumps(data))
+        self._remember(cache_key, data)
+    
+    def _remember(self, cache_key: str, data: Any):
+        """Simpan ke LRU in-memory, buang entry paling lama jika penuh"""
+        self.mem_cache[cache_key] = data
+        self.mem_cache.move_to_end(cache_key)
+        if len(self.mem_cache) > MEM_CACHE_SIZE:
+            self.mem_cache.popitem(last=False)
     
-    def get_merge_requests(self, target_branch: str, states: List[str], commit_message: Optional[str] = None) -> List[Dict]:
+    async def _mr_has_commit_message(self, mr: Dict, needle: str) -> bool:
+        """Check if any commit title in the MR contains the (already lowercased) search string"""
+        try:
+            cache_key = self._get_cache_key('mr_commits', {'iid': mr['iid']})
+            commits = self._get_cached_data(cache_key)
+            # [] yang di-cache (MR tanpa commit) juga hit, hanya None yang berarti belum ada di cache
+            if commits is None:
+                commits_url = f"{self.api_url}/projects/{self.project_id}/merge_requests/{mr['iid']}/commits"
+                commits = await self._get_json(commits_url)
+                self._save_to_cache(cache_key, commits)
+            return any(needle in commit['title'].lower() for commit in commits)
+        except aiohttp.ClientError as e:
+            logger.error(f"Error fetching commits for MR {mr['iid']}: {e}")
+            return False
+
+    async def _get_mr_page(self, params: Dict) -> Tuple[List[Dict], Optional[int]]:
+        """Get one page of MRs (cached) plus X-Total-Pages when the API reports it"""
+        cache_key = self._get_cache_key('merge_requests', params)
+        cached_data = self._get_cached_data(cache_key)
+        
+        if cached_data:
+            return cached_data, None
+        
+        url = f"{self.api_url}/projects/{self.project_id}/merge_requests"
+        # Entry kedaluwarsa direvalidasi dengan If-None-Match; 304 berarti isi halaman tidak berubah
+        stale_body, etag = self.cache.get_stale(cache_key)
+        mrs, headers = await self._request(
+            url, params=params, headers={'If-None-Match': etag} if stale_body is not None and etag else None
+        )
+        if mrs is None:
+            self.cache.set(cache_key, stale_body, etag)
+            return orjson.loads(stale_body), self._total_pages(headers)
+        if mrs:
+            self.cache.set(cache_key, orjson.dumps(mrs), headers.get('ETag'))
+        
+        return mrs, self._total_pages(headers)
+
+    @staticmethod
+    def _total_pages(headers) -> Optional[int]:
+        """Total halaman dari X-Total-Pages, atau dari Link rel="last" jika header itu tidak dikirim"""
+        total_pages = headers.get('X-Total-Pages')
+        if total_pages:
+            return int(total_pages)
+        # GitLab tidak mengirim X-Total-Pages untuk hasil yang sangat banyak, tapi Link tetap ada
+        match = re.search(r'<([^>]+)>;\s*rel="last"', headers.get('Link', ''))
+        if match:
+            page = urllib.parse.parse_qs(urllib.parse.urlparse(match.group(1)).query).get('page')
+            if page:
+                return int(page[0])
+        return None
+
+    async def get_merge_requests(self, target_branch: str, states: List[str], commit_message: Optional[str] = None) -> List[Dict]:
         all_mrs = []
         for state in states:
-            page = 1
-            while True:
-                params = {
-                    "state": state,
-                    "target_branch": target_branch,
-                    "per_page": 100,
-                    "page": page,
-                    "order_by": "updated_at",
-                    "sort": "desc"
-                }
-                
-                cache_path = self._get_cache_path('merge_requests', params)
-                cached_data = self._get_cached_data(cache_path)
-                
-                if cached_data:
-                    mrs = cached_data
-                else:
-                    try:
-                        url = f"{self.api_url}/projects/{self.project_id}/merge_requests"
-                        r = requests.get(url, headers=self.headers, params=params, verify=self.verify_ssl)
-                        r.raise_for_status()
-                        mrs = r.json()
-                        
-                        if not mrs:
-                            break
-                            
-                        self._save_to_cache(cache_path, mrs)
-                        
-                        # Rate limiting
-                        time.sleep(0.5)
-                        
-                    except requests.exceptions.RequestException as e:
-                        logger.error(f"Error fetching merge requests: {e}")
-                        break
-                
-                # Filter MRs based on commit message if provided
-                if commit_message:
-                    filtered_mrs = []
-                    for mr in mrs:
-                        try:
-                            # Get commits for this MR
-                            commits_url = f"{self.api_url}/projects/{self.project_id}/merge_requests/{mr['iid']}/commits"
-                            commits_r = requests.get(commits_url, headers=self.headers, verify=self.verify_ssl)
-                            commits_r.raise_for_status()
-                            commits = commits_r.json()
-                            
-                            # Check if any commit message contains the search string
-                            if any(commit_message.lower() in commit['title'].lower() for commit in commits):
-                                filtered_mrs.append(mr)
-                            
-                            # Rate limiting
-                            time.sleep(0.5)
-                            
-                        except requests.exceptions.RequestException as e:
-                            logger.error(f"Error fetching commits for MR {mr['iid']}: {e}")
-                            continue
-                    
-                    mrs = filtered_mrs
+            params = {
+                "state": state,
+                "target_branch": target_branch,
+                "per_page": 100,
+                "order_by": "updated_at",
+                "sort": "desc"
+            }
+            
+            try:
+                # Halaman 1 dulu untuk tahu total halaman
+                mrs, total_pages = await self._get_mr_page({**params, "page": 1})
+                # Salin dulu: list halaman 1 bisa jadi objek yang sama dengan isi cache in-memory
+                mrs = list(mrs)
                 
-                all_mrs.extend(mrs)
-                page += 1
+                if len(mrs) == params["per_page"]:
+                    if total_pages:
+                        # Sisa halaman diambil sekaligus
+                        pages = await asyncio.gather(
+                            *(self._get_mr_page({**params, "page": page}) for page in range(2, total_pages + 1))
+                        )
+                        for page_mrs, _ in pages:
+                            mrs.extend(page_mrs)
+                    else:
+                        # Total tidak diketahui (halaman 1 dari cache), ambil per jendela halaman
+                        page = 2
+                        while True:
+                            window = await asyncio.gather(
+                                *(self._get_mr_page({**params, "page": p}) for p in range(page, page + PREFETCH_PAGES))
+                            )
+                            last_page = False
+                            for page_mrs, _ in window:
+                                mrs.extend(page_mrs)
+                                if len(page_mrs) < params["per_page"]:
+                                    last_page = True
+                                    break
+                            if last_page:
+                                break
+                            page += PREFETCH_PAGES
                 
-                if not mrs:
-                    break
+            except aiohttp.ClientError as e:
+                logger.error(f"Error fetching merge requests: {e}")
+                continue
+            
+            # Filter MRs based on commit message if provided
+            if commit_message:
+                # Commits semua MR diambil secara paralel; string pencarian di-lowercase sekali saja
+                needle = commit_message.lower()
+                matches = await asyncio.gather(
+                    *(self._mr_has_commit_message(mr, needle) for mr in mrs)
+                )
+                mrs = [mr for mr, matched in zip(mrs, matches) if matched]
+            
+            all_mrs.extend(mrs)
                     
         return all_mrs
     
-    def get_mr_changes(self, mr_iid: int) -> List[Dict]:
-        cache_path = self._get_cache_path('mr_changes', {'mr_iid': mr_iid})
-        cached_data = self._get_cached_data(cache_path)
+    async def _fetch_file_size(self, change: Dict, ref: str):
+        """Set change['size_kb'] from the files API, falling back to the diff size"""
+        try:
+            file_url = f"{self.api_url}/projects/{self.project_id}/repository/files/{urllib.parse.quote(change['new_path'], safe='')}"
+            try:
+                # HEAD cukup: ukuran ada di header X-Gitlab-Size, isi file (base64) tidak ikut dikirim
+                _, headers = await self._request(file_url, params={'ref': ref}, method='HEAD')
+                size = headers.get('X-Gitlab-Size')
+                if size is not None:
+                    file_data = {'size': int(size)}
+                else:
+                    # Header tidak tersedia, fallback ke GET metadata lengkap
+                    file_data = await self._get_json(file_url, params={'ref': ref})
+            except (aiohttp.ClientResponseError, orjson.JSONDecodeError) as e:
+                # Jika file tidak ditemukan (atau response bukan JSON), coba dapatkan dari diff
+                if 'diff' in change:
+                    # Hitung ukuran dari diff
+                    size_bytes = len(change['diff'].encode('utf-8'))
+                    change['size_kb'] = round(size_bytes / 1024, 2)
+                else:
+                    change['size_kb'] = None
+                    print(f"\n⚠️ Could not get file size for {change['new_path']} at {ref[:8]}")
+                    print(f"Status code: {getattr(e, 'status', 'non-JSON response')}")
+                return
+
+            # Ukuran file ada di response
+            if 'size' in file_data:
+                size_kb = round(file_data['size'] / 1024, 2)
+                change['size_kb'] = size_kb
+                # Log file besar
+                if size_kb > 1000:  # File lebih dari 1MB
+                    print(f"\n⚠️ Large file detected at {ref[:8]}:")
+                    print(f"File: {change['new_path']}")
+                    print(f"Size: {size_kb:.2f}KB ({size_kb/1024:.2f}MB)")
+            else:
+                change['size_kb'] = None
+                print(f"\n⚠️ No size information for {change['new_path']} at {ref[:8]}")
+        except Exception as e:
+            self.error_collector.add_error(f"Error getting file size for {change['new_path']}: {e}")
+            change['size_kb'] = None
+
+    async def _fill_file_sizes(self, changes: List[Dict], ref: str):
+        """Set size_kb for every change, from the local clone when possible and the API otherwise"""
+        changes = [change for change in changes if 'new_path' in change]
+        pending = changes
+        if self.batcher and ref:
+            # Satu batch cat-file untuk semua file, tanpa network
+            sizes = self.batcher.sizes([(ref, change['new_path']) for change in changes])
+            pending = []
+            for change, size_kb in zip(changes, sizes):
+                if size_kb is None:
+                    # Commit belum di-fetch atau file dihapus, fallback ke API
+                    pending.append(change)
+                else:
+                    change['size_kb'] = round(size_kb, 2)
+        
+        # Tambahkan informasi ukuran file untuk sisa perubahan (paralel)
+        await asyncio.gather(*(self._fetch_file_size(change, ref) for change in pending))
+
+    async def get_mr_changes(self, mr_iid: int) -> List[Dict]:
+        cache_key = self._get_cache_key('mr_changes', {'mr_iid': mr_iid})
+        cached_data = self._get_cached_data(cache_key)
         
         if cached_data:
             return cached_data
@@ -179,53 +445,15 @@ class GitLabAPI:
         try:
             print(f"\n🔍 Checking MR #{mr_iid}...")
             url = f"{self.api_url}/projects/{self.project_id}/merge_requests/{mr_iid}/changes"
-            r = requests.get(url, headers=self.headers, verify=self.verify_ssl)
-            r.raise_for_status()
-            changes = r.json()["changes"]
+            mr_data = await self._get_json(url)
+            changes = mr_data["changes"]
             
-            # Tambahkan informasi ukuran file untuk setiap perubahan
-            for change in changes:
-                if 'new_path' in change:
-                    try:
-                        # Gunakan endpoint yang benar untuk mendapatkan file
-                        file_url = f"{self.api_url}/projects/{self.project_id}/repository/files/{urllib.parse.quote(change['new_path'], safe='')}/blob"
-                        file_params = {'ref': change.get('new_sha', '')}
-                        print(f"\nChecking file: {change['new_path']}")
-                        print(f"URL: {file_url}")
-                        print(f"Params: {file_params}")
-                        
-                        file_r = requests.get(file_url, headers=self.headers, params=file_params, verify=self.verify_ssl)
-                        
-                        if file_r.status_code == 200:
-                            file_data = file_r.json()
-                            # Ukuran file ada di response
-                            if 'size' in file_data:
-                                size_bytes = file_data['size']
-                                size_kb = round(size_bytes / 1024, 2)
-                                change['size_kb'] = size_kb
-                                print(f"File size: {size_kb:.2f}KB ({size_kb/1024:.2f}MB)")
-                            else:
-                                change['size_kb'] = None
-                                print(f"⚠️ No size information for {change['new_path']}")
-                        else:
-                            # Jika file tidak ditemukan, coba dapatkan dari diff
-                            if 'diff' in change:
-                                # Hitung ukuran dari diff
-                                size_bytes = len(change['diff'].encode('utf-8'))
-                                size_kb = round(size_bytes / 1024, 2)
-                                change['size_kb'] = size_kb
-                                print(f"File size from diff: {size_kb:.2f}KB")
-                            else:
-                                change['size_kb'] = None
-                                print(f"⚠️ Could not get file size for {change['new_path']}")
-                                print(f"Status code: {file_r.status_code}")
-                    except Exception as e:
-                        self.error_collector.add_error(f"Error getting file size for {change['new_path']}: {e}")
-                        change['size_kb'] = None
+            # Ukuran file dibaca pada head commit MR
+            await self._fill_file_sizes(changes, mr_data.get('sha') or '')
             
-            self._save_to_cache(cache_path, changes)
+            self._save_to_cache(cache_key, changes)
             return changes
-        except requests.exceptions.RequestException as e:
+        except aiohttp.ClientError as e:
             self.error_collector.add_error(f"Error fetching MR changes for MR {mr_iid}: {e}")
             return []
 
@@ -233,20 +461,18 @@ class GitLabAPI:
         """Encode branch name for URL"""
         return branch.replace('/', '%2F')
 
-    def get_branch_creation_date(self, branch: str) -> Optional[datetime]:
+    async def get_branch_creation_date(self, branch: str) -> Optional[datetime]:
         """Get the creation date of a branch"""
         try:
             encoded_branch = self._encode_branch_name(branch)
             url = f"{self.api_url}/projects/{self.project_id}/repository/branches/{encoded_branch}"
-            r = requests.get(url, headers=self.headers, verify=self.verify_ssl)
-            r.raise_for_status()
-            branch_info = r.json()
-            return datetime.fromisoformat(branch_info['commit']['created_at'].replace('Z', '+00:00'))
-        except requests.exceptions.RequestException as e:
+            branch_info = await self._get_json(url)
+            return ciso8601.parse_datetime(branch_info['commit']['created_at'])
+        except aiohttp.ClientError as e:
             self.error_collector.add_error(f"Error fetching branch creation date: {e}")
             return None
 
-    def get_commit_count(self, branch: str, start_date: Optional[datetime] = None, end_date: Optional[datetime] = None) -> int:
+    async def get_commit_count(self, branch: str, start_date: Optional[datetime] = None, end_date: Optional[datetime] = None) -> int:
         """Get total number of commits in a date range"""
         try:
             url = f"{self.api_url}/projects/{self.project_id}/repository/commits"
@@ -259,40 +485,37 @@ class GitLabAPI:
             
             # Tambahkan filter tanggal
             if start_date:
-                params["after"] = start_date.isoformat()
+                params["since"] = start_date.isoformat()
             if end_date:
-                params["before"] = end_date.isoformat()
+                params["until"] = end_date.isoformat()
             
-            r = requests.get(url, headers=self.headers, params=params, verify=self.verify_ssl)
-            r.raise_for_status()
+            _, headers = await self._request(url, params=params)
             
             # Total commit ada di header X-Total
-            if 'X-Total' in r.headers:
-                return int(r.headers['X-Total'])
+            if 'X-Total' in headers:
+                return int(headers['X-Total'])
             return 0
             
-        except requests.exceptions.RequestException as e:
+        except aiohttp.ClientError as e:
             self.error_collector.add_error(f"Error getting commit count: {e}")
             return 0
 
-    def get_commits_by_branch(self, branch: str, after_date: Optional[datetime] = None, limit: Optional[int] = None, 
+    async def get_commits_by_branch(self, branch: str, after_date: Optional[datetime] = None, limit: Optional[int] = None, 
                             start_date: Optional[datetime] = None, end_date: Optional[datetime] = None,
                             callback: Optional[Callable] = None) -> List[Dict]:
-        """Get commits from a specific branch and process them immediately"""
+        """Get commits from a specific branch and process them concurrently via an async callback"""
         print(f"\n🔍 Checking branch: {branch}")
         
         # First, verify branch exists
         try:
             encoded_branch = self._encode_branch_name(branch)
             url = f"{self.api_url}/projects/{self.project_id}/repository/branches/{encoded_branch}"
-            r = requests.get(url, headers=self.headers, verify=self.verify_ssl)
-            r.raise_for_status()
-            branch_info = r.json()
+            branch_info = await self._get_json(url)
             print(f"\n✅ Branch found:")
             print(f"Name: {branch_info['name']}")
             print(f"Commit: {branch_info['commit']['id']}")
             print(f"Created at: {branch_info['commit']['created_at']}")
-        except requests.exceptions.RequestException as e:
+        except aiohttp.ClientError as e:
             print(f"\n❌ Error accessing branch: {e}")
             return
         
@@ -308,147 +531,112 @@ class GitLabAPI:
             "order": "default"
         }
         
+        # Filter tanggal dikerjakan server (ISO-8601 penuh); end date inklusif sampai akhir hari
         if start_date:
-            # Format: YYYY-MM-DD
-            params["after"] = start_date.strftime("%Y-%m-%d")
-            print(f"Start date: {params['after']}")
+            params["since"] = start_date.isoformat()
+            print(f"Start date: {params['since']}")
         if end_date:
-            # Format: YYYY-MM-DD
-            params["before"] = end_date.strftime("%Y-%m-%d")
-            print(f"End date: {params['before']}")
+            params["until"] = end_date.replace(hour=23, minute=59, second=59).isoformat()
+            print(f"End date: {params['until']}")
         
         try:
             all_commits = []
             page = 1
-            total_commits = 0
+            last_page = False
+            # --limit-commits: halaman yang dibutuhkan sudah diketahui, jangan ambil lebih dari itu
+            limit_pages = math.ceil(limit / params["per_page"]) if limit else None
+            # Diisi dari X-Total-Pages/Link halaman pertama; None jika GitLab tidak mengirimnya
+            total_pages = None
             
-            while True:
-                params["page"] = page
-                r = requests.get(url, headers=self.headers, params=params, verify=self.verify_ssl)
-                r.raise_for_status()
-                commits = r.json()
-                
-                if not commits:
-                    break
-                
-                # Filter commits by date
-                for commit in commits:
-                    commit_date = datetime.fromisoformat(commit['created_at'].replace('Z', '+00:00'))
-                    # Skip if commit is outside date range
-                    if start_date and commit_date.date() < start_date.date():
-                        continue
-                    if end_date and commit_date.date() > end_date.date():
-                        continue
-                    all_commits.append(commit)
-                
-                # If we've gone past our date range, stop fetching
-                if commits and start_date:
-                    last_commit_date = datetime.fromisoformat(commits[-1]['created_at'].replace('Z', '+00:00'))
-                    if last_commit_date.date() < start_date.date():
-                        break
-                
-                total_commits += len(commits)
-                print(f"\rFetched {total_commits} commits...", end="")
+            with tqdm(desc="📥 Fetching commits", unit="commit") as pbar:
+                while not last_page:
+                    # Halaman pertama diambil sendiri supaya total halaman diketahui; berikutnya PREFETCH_PAGES
+                    # sekaligus, tanpa melewati halaman terakhir maupun halaman yang dibutuhkan --limit-commits
+                    end = page + (PREFETCH_PAGES if page > 1 else 1)
+                    last_needed = min((n for n in (limit_pages, total_pages) if n), default=None)
+                    if last_needed:
+                        end = min(end, last_needed + 1)
+                    window = await asyncio.gather(
+                        *(self._request(url, params={**params, "page": p}) for p in range(page, end))
+                    )
                 
-                if len(commits) < 100:  # Last page
-                    break
+                    for commits, headers in window:
+                        if total_pages is None:
+                            total_pages = self._total_pages(headers)
+                        all_commits.extend(commits)
+                        pbar.update(len(commits))
+                        
+                        # X-Next-Page kosong berarti ini halaman terakhir
+                        if not commits or not headers.get('X-Next-Page'):
+                            last_page = True
+                            break
                     
-                page += 1
-                time.sleep(0.5)  # Rate limiting
+                    # --limit-commits sudah terpenuhi, halaman berikutnya tidak perlu diambil
+                    if limit and len(all_commits) >= limit:
+                        last_page = True
+                
+                    page = end
+                    # Semua halaman yang dibutuhkan/ada sudah diambil
+                    if any(n and page > n for n in (limit_pages, total_pages)):
+                        last_page = True
             
-            print(f"\n\n✅ Found {len(all_commits)} commits in date range")
+            print(f"\n✅ Found {len(all_commits)} commits in date range")
             
             if all_commits:
                 print("\n📋 Commits in date range:")
                 for commit in all_commits[:5]:  # Show first 5 commits
-                    commit_date = datetime.fromisoformat(commit['created_at'].replace('Z', '+00:00'))
-                    print(f"ID: {commit['id'][:8]} | Date: {commit_date.strftime('%Y-%m-%d')} | Title: {commit['title']}")
+                    # created_at sudah ISO-8601 (YYYY-MM-DDTHH:MM:SS...), cukup ambil bagian tanggal
+                    print(f"ID: {commit['id'][:8]} | Date: {commit['created_at'][:10]} | Title: {commit['title']}")
                 
-                # Process filtered commits
-                processed = 0
-                for commit in all_commits:
-                    if callback:
-                        callback(commit)
-                    processed += 1
-                    if limit and processed >= limit:
-                        break
+                # Process filtered commits concurrently
+                selected = all_commits[:limit] if limit else all_commits
+                if callback:
+                    await asyncio.gather(*(callback(commit) for commit in selected))
+                processed = len(selected)
                 
                 print(f"\n✅ Processed {processed} commits")
             else:
                 print("\n❌ No commits found in the specified date range")
             
-        except requests.exceptions.RequestException as e:
+        except aiohttp.ClientError as e:
             print(f"\n❌ Error fetching commits: {e}")
             return
 
-    def get_commit_changes(self, commit_id: str) -> List[Dict]:
+    async def get_commit_changes(self, commit_id: str) -> List[Dict]:
         """Get changes for a specific commit"""
-        cache_path = self._get_cache_path('commit_changes', {'commit_id': commit_id})
-        cached_data = self._get_cached_data(cache_path)
+        cache_key = self._get_cache_key('commit_changes', {'commit_id': commit_id})
+        cached_data = self._get_cached_data(cache_key)
         
         if cached_data:
             return cached_data
             
         try:
             url = f"{self.api_url}/projects/{self.project_id}/repository/commits/{commit_id}/diff"
-            r = requests.get(url, headers=self.headers, verify=self.verify_ssl)
-            r.raise_for_status()
-            changes = r.json()
+            # Endpoint diff dipaginasi (default 20 file); halaman 1 dulu lalu sisanya sekaligus
+            changes, headers = await self._request(url, params={'per_page': 100, 'page': 1})
+            total_pages = self._total_pages(headers) or 1
+            pages = await asyncio.gather(
+                *(self._get_json(url, params={'per_page': 100, 'page': page}) for page in range(2, total_pages + 1))
+            )
+            for page_changes in pages:
+                changes.extend(page_changes)
             
-            # Tambahkan informasi ukuran file untuk setiap perubahan
-            for change in changes:
-                if 'new_path' in change:
-                    try:
-                        # Gunakan endpoint yang benar untuk mendapatkan file
-                        file_url = f"{self.api_url}/projects/{self.project_id}/repository/files/{urllib.parse.quote(change['new_path'], safe='')}/blob"
-                        file_params = {'ref': commit_id}
-                        file_r = requests.get(file_url, headers=self.headers, params=file_params, verify=self.verify_ssl)
-                        
-                        if file_r.status_code == 200:
-                            file_data = file_r.json()
-                            # Ukuran file ada di response
-                            if 'size' in file_data:
-                                size_bytes = file_data['size']
-                                size_kb = round(size_bytes / 1024, 2)
-                                change['size_kb'] = size_kb
-                                # Log file besar
-                                if size_kb > 1000:  # File lebih dari 1MB
-                                    print(f"\n⚠️ Large file detected in commit {commit_id[:8]}:")
-                                    print(f"File: {change['new_path']}")
-                                    print(f"Size: {size_kb:.2f}KB ({size_kb/1024:.2f}MB)")
-                            else:
-                                change['size_kb'] = None
-                                print(f"\n⚠️ No size information for {change['new_path']} in commit {commit_id[:8]}")
-                        else:
-                            # Jika file tidak ditemukan, coba dapatkan dari diff
-                            if 'diff' in change:
-                                # Hitung ukuran dari diff
-                                size_bytes = len(change['diff'].encode('utf-8'))
-                                size_kb = round(size_bytes / 1024, 2)
-                                change['size_kb'] = size_kb
-                            else:
-                                change['size_kb'] = None
-                                print(f"\n⚠️ Could not get file size for {change['new_path']} in commit {commit_id[:8]}")
-                                print(f"Status code: {file_r.status_code}")
-                    except Exception as e:
-                        self.error_collector.add_error(f"Error getting file size for {change['new_path']}: {e}")
-                        change['size_kb'] = None
+            # Ukuran semua file di commit di-fetch paralel
+            await self._fill_file_sizes(changes, commit_id)
             
-            self._save_to_cache(cache_path, changes)
+            self._save_to_cache(cache_key, changes)
             return changes
-        except requests.exceptions.RequestException as e:
+        except aiohttp.ClientError as e:
             self.error_collector.add_error(f"Error fetching changes for commit {commit_id}: {e}")
             return []
 
-    def check_branch_and_commits(self, branch: str):
+    async def check_branch_and_commits(self, branch: str):
         """Check branch existence and get some commits without date filter"""
         try:
             # Check branch existence
             encoded_branch = self._encode_branch_name(branch)
             url = f"{self.api_url}/projects/{self.project_id}/repository/branches/{encoded_branch}"
-            r = requests.get(url, headers=self.headers, verify=self.verify_ssl)
-            r.raise_for_status()
-            branch_info = r.json()
+            branch_info = await self._get_json(url)
             print(f"\n📌 Branch info:")
             print(f"Name: {branch_info['name']}")
             print(f"Commit: {branch_info['commit']['id']}")
@@ -462,9 +650,7 @@ class GitLabAPI:
                 "page": 1
             }
             
-            r = requests.get(url, headers=self.headers, params=params, verify=self.verify_ssl)
-            r.raise_for_status()
-            commits = r.json()
+            commits = await self._get_json(url, params=params)
             
             print(f"\n📦 Sample commits:")
             for commit in commits:
@@ -472,7 +658,7 @@ class GitLabAPI:
             
             return True
             
-        except requests.exceptions.RequestException as e:
+        except aiohttp.ClientError as e:
             print(f"\n❌ Error checking branch: {e}")
             return False
 
@@ -480,123 +666,114 @@ class FileAnalyzer:
     def __init__(self, file_patterns: Optional[List[str]] = None, 
                  min_size_kb: Optional[float] = None,
                  max_size_kb: Optional[float] = None):
-        self.file_patterns = [re.compile(pattern) for pattern in (file_patterns or [])]
+        # Semua pattern digabung jadi satu regex agar cukup satu search per file
+        self.combined_pattern = re.compile('|'.join(f'(?:{p})' for p in file_patterns)) if file_patterns else None
         self.min_size_kb = min_size_kb
         self.max_size_kb = max_size_kb
         self.error_collector = ErrorCollector()
     
     def should_analyze_file(self, filepath: str, size_kb: float) -> bool:
-        if self.file_patterns and not any(pattern.search(filepath) for pattern in self.file_patterns):
+        if self.combined_pattern and not self.combined_pattern.search(filepath):
             return False
-        if self.min_size_kb and size_kb < self.min_size_kb:
+        if self.min_size_kb is not None and size_kb < self.min_size_kb:
             return False
-        if self.max_size_kb and size_kb > self.max_size_kb:
+        if self.max_size_kb is not None and size_kb > self.max_size_kb:
             return False
         return True
     
-    def get_file_size(self, filepath: str) -> Optional[float]:
-        try:
-            size_bytes = os.path.getsize(filepath)
-            size_kb = round(size_bytes / 1024, 2)
-            return size_kb if self.should_analyze_file(filepath, size_kb) else None
-        except Exception as e:
-            self.error_collector.add_error(f"Error getting file size for {filepath}: {e}")
+    def filter_size(self, filepath: str, size_kb: Optional[float]) -> Optional[float]:
+        """Size in KB if the file passes the pattern/size filters, else None"""
+        if size_kb is None:
             return None
+        return size_kb if self.should_analyze_file(filepath, size_kb) else None
 
 # Tambahkan di bagian atas file
-NON_STANDARD_EXTS = ['.apk', '.aab', '.so', '.jar', '.dex', '.class', '.aar']
-
-def is_non_standard(filepath):
-    return any(filepath.lower().endswith(ext) for ext in NON_STANDARD_EXTS)
+NON_STANDARD_EXTS_SET = frozenset({'.apk', '.aab', '.so', '.jar', '.dex', '.class', '.aar'})
 
 class ReportGenerator:
     def __init__(self, output_excel: str):
         self.output_excel = output_excel
-        self.data = []
-        self.commit_summary = {}  # Untuk menyimpan ringkasan per commit
+        # Data disimpan per kolom agar DataFrame bisa dibangun langsung dari list
+        self.cols = {
+            "MR Title": [],
+            "MR ID": [],
+            "MR State": [],
+            "File": [],
+            "File Size (KB)": []
+        }
+        # Ringkasan per commit/MR, dihitung dengan groupby di generate_excel
+        self.summary_df = pd.DataFrame()
         self.error_collector = ErrorCollector()
     
     def add_data(self, mr_title: str, mr_id: int, mr_state: str, 
-                file_path: str, file_size: Optional[float], non_standard: Optional[bool] = None):
-        if non_standard is None:
-            non_standard = is_non_standard(file_path)
-        self.data.append({
-            "MR Title": mr_title,
-            "MR ID": mr_id,
-            "MR State": mr_state,
-            "File": file_path,
-            "File Size (KB)": file_size,
-            "NonStandard": non_standard
-        })
-        
-        # Update ringkasan commit
-        if mr_id not in self.commit_summary:
-            self.commit_summary[mr_id] = {
-                'title': mr_title,
-                'total_size': 0,
-                'file_count': 0,
-                'files': []
-            }
-        
-        if file_size is not None:
-            self.commit_summary[mr_id]['total_size'] += file_size
-            self.commit_summary[mr_id]['file_count'] += 1
-            self.commit_summary[mr_id]['files'].append({
-                'path': file_path,
-                'size': file_size
+                file_path: str, file_size: Optional[float]):
+        # NonStandard, Status dan ringkasan per commit dihitung sekaligus (vectorized) di generate_excel
+        self.cols["MR Title"].append(mr_title)
+        self.cols["MR ID"].append(mr_id)
+        self.cols["MR State"].append(mr_state)
+        self.cols["File"].append(file_path)
+        self.cols["File Size (KB)"].append(file_size)
+    
+    def _summarize(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Total size and file count per commit/MR (files without a size are not counted)"""
+        return (
+            df.groupby('MR ID', sort=False)
+            .agg(**{
+                'Title': ('MR Title', 'first'),
+                'Total Size (KB)': ('File Size (KB)', 'sum'),
+                'File Count': ('File Size (KB)', 'count'),
             })
+            .reset_index()
+            .rename(columns={'MR ID': 'Commit ID'})
+            .sort_values('Total Size (KB)', ascending=False, kind='stable')
+        )
     
     def generate_excel(self):
         try:
             # Buat DataFrame dan urutkan berdasarkan ukuran file
-            df = pd.DataFrame(self.data)
-            if not df.empty and 'File Size (KB)' in df.columns:
-                df = df.sort_values('File Size (KB)', ascending=False)
+            df = pd.DataFrame(self.cols)
+            # Judul dan state berulang untuk setiap file dalam satu MR/commit; simpan sebagai category
+            # supaya tiap nilai unik cukup disimpan sekali
+            df = df.astype({'MR Title': 'category', 'MR State': 'category'})
+            if not df.empty:
+                df['File Size (KB)'] = pd.to_numeric(df['File Size (KB)'], errors='coerce')
+                df = df.sort_values('File Size (KB)', ascending=False, kind='stable')
+                ext = file_extensions(df['File'])
+                df['NonStandard'] = is_non_standard_vectorized(ext)
+                df['Status'] = validate_file_size_vectorized(ext, df['File Size (KB)'] / 1024)
+                self.summary_df = self._summarize(df)
             
             # Simpan ke Excel
-            with pd.ExcelWriter(self.output_excel, engine='openpyxl') as writer:
+            # xlsxwriter menulis XML langsung tanpa objek Cell openpyxl per sel.
+            # constant_memory tidak dipakai: pandas menulis body per kolom, sedangkan
+            # mode itu membuang tulisan ke baris yang sudah lewat.
+            with pd.ExcelWriter(self.output_excel, engine='xlsxwriter') as writer:
                 # Sheet untuk data file
                 df.to_excel(writer, sheet_name='File Analysis', index=False)
                 
                 # Sheet untuk ringkasan commit
-                if self.commit_summary:
-                    summary_data = []
-                    for commit_id, info in self.commit_summary.items():
-                        summary_data.append({
-                            'Commit ID': commit_id,
-                            'Title': info['title'],
-                            'Total Size (KB)': round(info['total_size'], 2),
-                            'File Count': info['file_count']
-                        })
-                    
-                    summary_df = pd.DataFrame(summary_data)
-                    summary_df = summary_df.sort_values('Total Size (KB)', ascending=False)
-                    summary_df.to_excel(writer, sheet_name='Commit Summary', index=False)
+                if not self.summary_df.empty:
+                    self.summary_df.round({'Total Size (KB)': 2}).to_excel(writer, sheet_name='Commit Summary', index=False)
                     
-                    # Tambahkan sheet untuk detail file per commit
-                    for commit_id, info in self.commit_summary.items():
-                        files_df = pd.DataFrame(info['files'])
-                        files_df = files_df.sort_values('size', ascending=False)
-                        sheet_name = f'Commit_{commit_id[:8]}'
-                        files_df.to_excel(writer, sheet_name=sheet_name, index=False)
+                    # Detail file per commit dalam satu sheet (bisa difilter per Commit ID di Excel)
+                    files_df = df.loc[df['File Size (KB)'].notna(), ['MR ID', 'File', 'File Size (KB)']]
+                    files_df.columns = ['Commit ID', 'path', 'size']
+                    if not files_df.empty:
+                        files_df = files_df.sort_values(['Commit ID', 'size'], ascending=[True, False])
+                        files_df.to_excel(writer, sheet_name='Files By Commit', index=False)
+                        writer.sheets['Files By Commit'].autofilter(0, 0, len(files_df), len(files_df.columns) - 1)
             
             logger.info(f"✅ Data disimpan ke file: {self.output_excel}")
             
             # Tampilkan ringkasan commit terbesar
-            if self.commit_summary:
+            if not self.summary_df.empty:
                 print("\n📊 Top 5 Commits by Size:")
                 print("=" * 80)
                 print(f"{'Commit ID':<10} {'Total Size (KB)':<15} {'File Count':<12} Title")
                 print("-" * 80)
                 
-                sorted_commits = sorted(
-                    self.commit_summary.items(),
-                    key=lambda x: x[1]['total_size'],
-                    reverse=True
-                )[:5]
-                
-                for commit_id, info in sorted_commits:
-                    print(f"{commit_id[:8]:<10} {info['total_size']:<15.2f} {info['file_count']:<12} {info['title']}")
+                for commit_id, title, total_size, file_count in self.summary_df.head(5).itertuples(index=False, name=None):
+                    print(f"{str(commit_id)[:8]:<10} {total_size:<15.2f} {file_count:<12} {title}")
                 print("=" * 80)
             
             return df
@@ -614,91 +791,326 @@ class ReportGenerator:
             plots_dir = Path('plots')
             plots_dir.mkdir(exist_ok=True)
             
-            # Plot 1: File Size Distribution
-            plt.figure(figsize=(12, 6))
-            sns.histplot(data=df, x='File Size (KB)', bins=30)
-            plt.title('Distribusi Ukuran File')
-            plt.savefig(plots_dir / 'file_size_distribution.png')
-            plt.close()
+            # Semua plot dirender dalam satu figure (sekali savefig)
+            fig, axes = plt.subplots(1, 3, figsize=(18, 6))
+            
+            # Plot 1: File Size Distribution (histogram dihitung langsung dengan numpy)
+            counts, edges = np.histogram(df['File Size (KB)'].dropna().to_numpy(), bins=30)
+            axes[0].stairs(counts, edges, fill=True)
+            axes[0].set_title('Distribusi Ukuran File')
+            axes[0].set_xlabel('File Size (KB)')
+            axes[0].set_ylabel('Count')
             
             # Plot 2: Top 10 Largest Files
-            plt.figure(figsize=(12, 6))
             top_files = df.nlargest(10, 'File Size (KB)')
-            sns.barplot(data=top_files, x='File Size (KB)', y='File')
-            plt.title('10 File Terbesar')
-            plt.tight_layout()
-            plt.savefig(plots_dir / 'top_10_largest_files.png')
-            plt.close()
+            sns.barplot(data=top_files, x='File Size (KB)', y='File', ax=axes[1])
+            axes[1].set_title('10 File Terbesar')
             
             # Plot 3: Commit Size Distribution
-            if self.commit_summary:
-                commit_sizes = [info['total_size'] for info in self.commit_summary.values()]
-                plt.figure(figsize=(12, 6))
-                sns.histplot(data=commit_sizes, bins=30)
-                plt.title('Distribusi Ukuran Commit')
-                plt.xlabel('Total Size (KB)')
-                plt.savefig(plots_dir / 'commit_size_distribution.png')
-                plt.close()
+            if not self.summary_df.empty:
+                counts, edges = np.histogram(self.summary_df['Total Size (KB)'].to_numpy(), bins=30)
+                axes[2].stairs(counts, edges, fill=True)
+                axes[2].set_title('Distribusi Ukuran Commit')
+                axes[2].set_xlabel('Total Size (KB)')
+                axes[2].set_ylabel('Count')
+            else:
+                axes[2].set_visible(False)
+            
+            fig.tight_layout()
+            fig.savefig(plots_dir / 'report.png', dpi=100)
+            plt.close(fig)
             
             logger.info("✅ Visualisasi disimpan di folder 'plots'")
         except Exception as e:
             self.error_collector.add_error(f"Error generating plots: {e}")
 
-def get_file_size_in_commit(repo_path, commit_sha, file_path):
-    """Get file size in KB for a file at a specific commit using git ls-tree (no checkout needed)"""
-    cmd = [
-        "git", "-C", repo_path, "ls-tree", "-l", commit_sha, file_path
+class GitBatcher:
+    """Satu proses `git cat-file --batch-check` untuk query ukuran banyak blob sekaligus"""
+    # Batasi jumlah query yang ditulis sebelum output dibaca agar pipe tidak penuh/deadlock
+    BATCH_SIZE = 256
+    
+    def __init__(self, repo_path, cache=None):
+        # Cache object spec ("sha:path" atau blob oid) -> size KB; boleh dibagi antar batcher (dict aman antar thread)
+        self.cache = cache if cache is not None else {}
+        self.proc = subprocess.Popen(
+            ["git", "-C", repo_path, "cat-file", "--batch-check=%(objectname) %(objecttype) %(objectsize)"],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True, bufsize=1
+        )
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+    
+    @staticmethod
+    def _parse_size_kb(line):
+        # Format: "<objectname> <objecttype> <objectsize>" atau "<query> missing"
+        parts = line.split()
+        if len(parts) != 3 or parts[1] != "blob":
+            return None
+        try:
+            return int(parts[2]) / 1024  # size in KB
+        except ValueError:
+            return None
+    
+    def sizes(self, queries):
+        """Get file sizes in KB for a list of (commit_sha, file_path), in the same order"""
+        return self.object_sizes([f"{sha}:{path}" for sha, path in queries])
+    
+    def object_sizes(self, specs):
+        """Get sizes in KB for a list of object specs (blob oid or `sha:path`), in the same order"""
+        # Hanya spec yang belum pernah ditanyakan yang dikirim ke git
+        missing = list(dict.fromkeys(spec for spec in specs if spec not in self.cache))
+        for i in range(0, len(missing), self.BATCH_SIZE):
+            chunk = missing[i:i + self.BATCH_SIZE]
+            # batch-check menjawab sesuai urutan input, jadi tulis semua dulu lalu baca semua
+            self.proc.stdin.write("".join(f"{spec}\n" for spec in chunk))
+            self.proc.stdin.flush()
+            for spec in chunk:
+                self.cache[spec] = self._parse_size_kb(self.proc.stdout.readline())
+        return [self.cache[spec] for spec in specs]
+    
+    def close(self):
+        if self.proc.poll() is None:
+            self.proc.stdin.close()
+            self.proc.wait()
+
+# Penanda baris header commit pada output `git log --pretty=format:...` (record separator, tidak muncul di path)
+COMMIT_SENTINEL = "\x1e"
+# Field header dipisah NUL, sehingga subject yang berisi '|' tetap aman
+COMMIT_FORMAT = "%x1e%H%x00%ad%x00%s"
+
+def iter_log_commits(lines):
+    """Parse `git log --pretty=format:COMMIT_FORMAT --raw --no-abbrev` output into (sha, date, title, [(file, blob oid)])"""
+    current = None
+    for line in lines:
+        line = line.rstrip('\n')
+        if line.startswith(COMMIT_SENTINEL):
+            if current:
+                yield current
+            # Dengan -m, merge commit muncul sekali per parent (header yang sama diulang)
+            sha, date, title = line[len(COMMIT_SENTINEL):].split('\x00', 2)
+            current = (sha, date, title.strip(), [])
+        elif line.startswith(':') and current:
+            # ":<mode lama> <mode baru> <oid lama> <oid baru> <status>\t<path>[\t<path baru>]"
+            meta, *paths = line.split('\t')
+            current[3].append((paths[-1], meta.split()[3]))
+    if current:
+        yield current
+
+# Status delta pygit2 yang setara dengan --diff-filter=AMR (Added/Modified/Renamed)
+PYGIT2_AMR_STATUSES = (
+    frozenset({pygit2.GIT_DELTA_ADDED, pygit2.GIT_DELTA_MODIFIED, pygit2.GIT_DELTA_RENAMED}) if pygit2 else frozenset()
+)
+
+def git_log_date_args(start_date=None, end_date=None):
+    """--since/--until untuk rentang YYYY-MM-DD inklusif"""
+    # Tanpa jam, git mengisi jam saat ini pada tanggal itu; jadi hasil tergantung kapan script dijalankan
+    args = []
+    if start_date:
+        args.append(f"--since={start_date} 00:00:00")
+    if end_date:
+        args.append(f"--until={end_date} 23:59:59")
+    return args
+
+def pygit2_commit_changes(repo_path, start_date=None, end_date=None, path_filter=None, max_count=None):
+    """In-process padanan `git log -m --name-only` + cat-file via pygit2 -> (jumlah commit, list (sha, date, title, file, size KB))"""
+    repo = pygit2.Repository(repo_path)
+    walker = repo.walk(repo.head.target, pygit2.GIT_SORT_TIME)
+    # Aturan tanggal sama dengan backend git log (lihat git_log_date_args): committer date,
+    # start dari 00:00:00 dan end date inklusif sampai 23:59:59 waktu lokal
+    since_ts = datetime.strptime(start_date, '%Y-%m-%d').timestamp() if start_date else None
+    until_ts = (datetime.strptime(end_date, '%Y-%m-%d') + timedelta(days=1)).timestamp() if end_date else None
+    size_cache = {}
+    changed = []
+    commit_count = 0
+    for commit in walker:
+        if (since_ts and commit.commit_time < since_ts) or (until_ts and commit.commit_time >= until_ts):
+            continue
+        # Merge commit di-diff terhadap tiap parent (seperti -m); root commit terhadap tree kosong
+        diffs = [repo.diff(parent, commit) for parent in commit.parents] or [commit.tree.diff_to_tree(swap=True)]
+        # Sama seperti --diff-filter=AMR: file yang dihapus tidak diproses, dan commit tanpa
+        # perubahan A/M/R sama sekali tidak ikut dihitung (juga untuk --max-count)
+        deltas = [delta for diff in diffs for delta in diff.deltas if delta.status in PYGIT2_AMR_STATUSES]
+        if not deltas:
+            continue
+        # Padanan --max-count: walk berhenti, sisa history tidak ditelusuri
+        if max_count and commit_count >= max_count:
+            break
+        commit_count += 1
+        sha = str(commit.id)
+        author_tz = timezone(timedelta(minutes=commit.author.offset))
+        date = datetime.fromtimestamp(commit.author.time, tz=author_tz).strftime('%Y-%m-%d')
+        title = commit.message.split('\n', 1)[0].strip()
+        for delta in deltas:
+            file_path = delta.new_file.path
+            if path_filter and not path_filter(file_path):
+                continue
+            blob_id = delta.new_file.id
+            if blob_id not in size_cache:
+                # Submodule (gitlink) menunjuk commit di repo lain: tidak ada blob, ukuran kosong
+                # seperti jawaban "missing" dari cat-file di backend git log
+                if delta.new_file.mode == pygit2.GIT_FILEMODE_COMMIT:
+                    size_cache[blob_id] = None
+                else:
+                    size_cache[blob_id] = repo[blob_id].size / 1024  # size in KB
+            changed.append((sha, date, title, file_path, size_cache[blob_id]))
+    return commit_count, changed
+
+def bounded_map(executor, fn, iterable, window):
+    """Seperti executor.map, tapi maksimal `window` future yang berjalan; input dibaca sesuai kebutuhan, hasil urut"""
+    # executor.map langsung submit seluruh iterable, jadi generator streaming tetap tertampung semua sebagai future
+    pending = deque()
+    for item in iterable:
+        pending.append(executor.submit(fn, item))
+        if len(pending) >= window:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+def git_log_commit_changes(repo_path, start_date=None, end_date=None, path_filter=None, revisions=None, max_count=None):
+    """Changed files per commit via `git log -m --raw` + cat-file -> (jumlah commit, list (sha, date, title, file, size KB))"""
+    # Get list of commits in date range beserta file yang berubah, dalam satu proses git
+    log_cmd = [
+        "git", "-C", repo_path, "log", "-m", "--raw", "--no-abbrev", "--diff-filter=AMR",
+        f"--pretty=format:{COMMIT_FORMAT}", "--date=short"
     ]
-    result = subprocess.run(cmd, capture_output=True, text=True)
-    if result.stdout:
-        parts = result.stdout.strip().split()
-        if len(parts) >= 4:
-            try:
-                return int(parts[3]) / 1024  # size in KB
-            except Exception:
-                return None
-    return None
-
-def validate_file_size(file_path, size_mb):
-    file_lower = file_path.lower()
-    if file_lower.endswith(('.xml',)):
-        return "OK" if size_mb is not None and size_mb <= 0.02 else "OVERSIZE"  # 20 KB
-    if file_lower.endswith(('.png', '.jpg', '.jpeg')):
-        return "OK" if size_mb is not None and size_mb <= 0.05 else "OVERSIZE"  # 50 KB
-    if file_lower.endswith(('.webp',)):
-        return "OK" if size_mb is not None and size_mb <= 0.2 else "OVERSIZE"   # 200 KB
-    if file_lower.endswith(('.ogg', '.aac')):
-        return "OK" if size_mb is not None and size_mb <= 0.3 else "OVERSIZE"   # 300 KB
-    if file_lower.endswith(('.mp4', '.mov', '.m4v')):
-        return "OK" if size_mb is not None and size_mb <= 1 else "OVERSIZE"     # 1 MB
-    if file_lower.endswith(('.json',)):
-        return "OK" if size_mb is not None and size_mb <= 0.1 else "OVERSIZE"   # 100 KB
-    if file_lower.endswith(('.ttf', '.otf')):
-        return "OK" if size_mb is not None and size_mb <= 0.5 else "OVERSIZE"   # 500 KB
-    if file_lower.endswith(('.so',)):
-        return "OK" if size_mb is not None and size_mb <= 5 else "OVERSIZE"     # 5 MB
-    if file_lower.endswith(('.dex',)):
-        return "OK" if size_mb is not None and size_mb <= 10 else "OVERSIZE"    # 10 MB
-    # Default: OK
-    return "OK"
+    log_cmd.extend(git_log_date_args(start_date, end_date))
+    if max_count:
+        log_cmd.append(f"--max-count={max_count}")
+    # Misal ["--all"] untuk semua ref; default HEAD
+    log_cmd.extend(revisions or [])
+    # Output git log di-stream baris per baris, tidak ditampung seluruhnya di memori
+    proc = subprocess.Popen(log_cmd, stdout=subprocess.PIPE, text=True)
+    # Satu pipe cat-file per worker thread (thread-local) supaya stdin tidak saling tumpang tindih
+    local = threading.local()
+    # Ukuran di-cache per blob oid: isi file yang sama di banyak commit cukup di-query sekali
+    size_cache = {}
+    batchers = []
+    batchers_lock = threading.Lock()
+
+    def process_one_commit(commit):
+        sha, date, title, files = commit
+        files = [(f, oid) for f, oid in files if not path_filter or path_filter(f)]
+        if not files:
+            return sha, []
+        batcher = getattr(local, "batcher", None)
+        if batcher is None:
+            batcher = local.batcher = GitBatcher(repo_path, cache=size_cache)
+            with batchers_lock:
+                batchers.append(batcher)
+        sizes = batcher.object_sizes([oid for _, oid in files])
+        return sha, [(sha, date, title, f, size_kb) for (f, _), size_kb in zip(files, sizes)]
+
+    changed = []
+    seen_shas = set()
+    try:
+        workers = os.cpu_count() or 1
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            # Jumlah commit belum diketahui saat streaming, jadi progress bar tanpa total
+            results = bounded_map(executor, process_one_commit, iter_log_commits(proc.stdout), window=workers * 4)
+            for sha, rows in tqdm(results, desc="Processing commits", unit="commit", mininterval=0.5):
+                seen_shas.add(sha)
+                changed.extend(rows)
+    finally:
+        proc.stdout.close()
+        proc.wait()
+        for batcher in batchers:
+            batcher.close()
+    return len(seen_shas), changed
+
+# Batas ukuran per ekstensi (MB); ekstensi lain dianggap OK
+EXT_LIMITS: Dict[str, float] = {
+    '.xml': 0.02,
+    '.png': 0.05, '.jpg': 0.05, '.jpeg': 0.05,
+    '.webp': 0.2,
+    '.ogg': 0.3, '.aac': 0.3,
+    '.mp4': 1, '.mov': 1, '.m4v': 1,
+    '.json': 0.1,
+    '.ttf': 0.5, '.otf': 0.5,
+    '.so': 5,
+    '.dex': 10,
+}
+
+# Tabel aturan validasi untuk sheet "Validation Rules" (konstan, dibangun sekali)
+VALIDATION_RULES_DF = pd.DataFrame([
+    ["Icon/Ilustrasi Sederhana", "XML (Vector)", "0.02", "< 20 KB"],
+    ["Icon/Ilustrasi Sederhana", "PNG/JPG", "0.05", "≤ 50 KB"],
+    ["Gambar Konten", "WebP", "0.2", "≤ 200 KB"],
+    ["Gambar Fullscreen", "WebP/JPG", "0.5", "≤ 500 KB (1080x1920)"],
+    ["Audio Efek", "OGG/AAC", "0.1", "< 100 KB (<5s)"],
+    ["Audio Musik Pendek", "OGG/AAC", "0.3", "≤ 300 KB"],
+    ["Video Pendek", "MP4/MOV/M4V", "1", "< 1 MB (480p)"],
+    ["Lottie Animation", "JSON", "0.2", "50–200 KB"],
+    ["Native Library", ".so", "5", "≤ 5 MB per ABI"],
+    ["DEX/Kode", ".dex", "10", "≤ 10 MB per file"],
+    ["JSON/Data Bundling", ".json", "0.1", "≤ 100 KB"],
+    ["Font", ".ttf/.otf", "0.5", "≤ 500 KB"],
+    ["Resource XML", ".xml", "0.02", "< 20 KB"],
+], columns=["Kategori", "Ekstensi/Format", "Batas Maksimal (MB)", "Catatan"])
+
+# Ekstensi yang punya batas ukuran; selain ini validasi selalu OK
+BOUNDED_EXTS = frozenset(EXT_LIMITS)
+
+def is_bounded(file_path):
+    _, dot, ext = file_path.lower().rpartition('.')
+    return bool(dot) and '.' + ext in BOUNDED_EXTS
+
+def _make_path_filter(compiled, only_bounded=False):
+    """Predicate path untuk history walk, atau None jika tidak ada filter sama sekali"""
+    if not compiled and not only_bounded:
+        return None
+    if not only_bounded:
+        return compiled.search
+    # --only-bounded: file tanpa batas ukuran selalu OK, jadi ukurannya tidak perlu di-query sama sekali
+    def path_filter(file_path):
+        return (not compiled or compiled.search(file_path)) and is_bounded(file_path)
+    return path_filter
+
+def file_extensions(paths: pd.Series) -> pd.Series:
+    """Lowercased file extension per path (vectorized), NaN if there is none"""
+    return paths.str.lower().str.extract(r'(\.[^./\\]+)$', expand=False)
+
+# Helper *_vectorized menerima kolom ekstensi dari file_extensions(), supaya lower()+extract
+# cukup dilakukan sekali per report meskipun dipakai beberapa klasifikasi
+
+def is_non_standard_vectorized(exts: pd.Series) -> pd.Series:
+    """Flag NonStandard per row: extension is in NON_STANDARD_EXTS_SET"""
+    return exts.isin(NON_STANDARD_EXTS_SET)
+
+def validate_file_size_vectorized(exts: pd.Series, sizes_mb: pd.Series) -> np.ndarray:
+    """OK/OVERSIZE per row against EXT_LIMITS, from a column of extensions and sizes (same row order)"""
+    limits = exts.map(EXT_LIMITS)
+    # Kolom ukuran bisa bertipe object (berisi None); paksa jadi float supaya None -> NaN
+    sizes_mb = pd.to_numeric(sizes_mb, errors='coerce')
+    # Ekstensi tanpa batas selalu OK; ukuran kosong untuk ekstensi berbatas dianggap OVERSIZE
+    return np.where(limits.isna().to_numpy() | (sizes_mb <= limits).to_numpy(), "OK", "OVERSIZE")
+
+# Binary hasil build; tidak masuk Optimization Candidates karena tidak bisa dikompres ulang di project
+BINARY_EXTS = ('.so', '.dex', '.aar', '.apk', '.jar')
+
+def _hints(exts, hint):
+    return dict.fromkeys(exts, hint)
+
+OPTIMIZATION_HINTS = {
+    **_hints(('.png', '.jpg', '.jpeg'), "Kompres ke WebP, turunkan resolusi/quality"),
+    '.webp': "Pastikan sudah lossy, cek resolusi",
+    **_hints(('.ogg', '.aac', '.mp3'), "Turunkan bitrate, kompres audio"),
+    '.mp4': "Turunkan resolusi/bitrate video",
+    **_hints(('.json', '.xml'), "Pertimbangkan compress GZIP atau split"),
+    **_hints(('.ttf', '.otf'), "Pisahkan font ke modul terpisah"),
+    **_hints(BINARY_EXTS, "File binary besar, audit manual kebutuhan file"),
+}
+DEFAULT_OPTIMIZATION_HINT = "Audit manual, cek kebutuhan file"
 
 def suggest_optimization(file_path, size_mb):
-    ext = file_path.lower()
-    if ext.endswith(('.png', '.jpg', '.jpeg')):
-        return "Kompres ke WebP, turunkan resolusi/quality"
-    if ext.endswith('.webp'):
-        return "Pastikan sudah lossy, cek resolusi"
-    if ext.endswith(('.ogg', '.aac', '.mp3')):
-        return "Turunkan bitrate, kompres audio"
-    if ext.endswith('.mp4'):
-        return "Turunkan resolusi/bitrate video"
-    if ext.endswith(('.json', '.xml')):
-        return "Pertimbangkan compress GZIP atau split"
-    if ext.endswith(('.ttf', '.otf')):
-        return "Pisahkan font ke modul terpisah"
-    if ext.endswith(('.so', '.dex', '.aar', '.apk', '.jar')):
-        return "File binary besar, audit manual kebutuhan file"
-    return "Audit manual, cek kebutuhan file"
+    _, dot, ext = file_path.lower().rpartition('.')
+    return OPTIMIZATION_HINTS.get('.' + ext, DEFAULT_OPTIMIZATION_HINT) if dot else DEFAULT_OPTIMIZATION_HINT
+
+def suggest_optimization_vectorized(exts: pd.Series) -> pd.Series:
+    """Vectorized suggest_optimization over a column of extensions"""
+    return exts.map(OPTIMIZATION_HINTS).fillna(DEFAULT_OPTIMIZATION_HINT)
 
 RELEVANT_FOLDERS = [
     'res', 'assets', 'jniLibs', 'lib', 'raw', 'fonts'
@@ -707,116 +1119,147 @@ RELEVANT_EXTS = [
     '.png', '.jpg', '.jpeg', '.webp', '.xml', '.json', '.mp3', '.ogg', '.aac', '.ttf', '.otf', '.so', '.dex', '.aar', '.jar', '.apk', '.mp4'
 ]
 
+# Satu regex: salah satu komponen path adalah folder relevan (case-sensitive), ekstensi case-insensitive
+_SEP = re.escape(os.sep)
+_RELEVANT_RE = re.compile(
+    r'(?:^|%s)(?:%s)%s.*(?i:%s)$' % (
+        _SEP,
+        '|'.join(map(re.escape, RELEVANT_FOLDERS)),
+        _SEP,
+        '|'.join(map(re.escape, RELEVANT_EXTS)),
+    ),
+    re.DOTALL,
+)
+
 def is_relevant_file(file_path):
-    parts = file_path.split(os.sep)
-    if not any(folder in parts for folder in RELEVANT_FOLDERS):
-        return False
-    if not any(file_path.lower().endswith(ext) for ext in RELEVANT_EXTS):
-        return False
-    return True
+    return _RELEVANT_RE.search(file_path) is not None
+
+def scan_files(path):
+    """Yield os.DirEntry for every file under path (recursive, same entries as os.walk's files), skipping .git directories"""
+    # Seperti os.walk: folder yang tidak bisa dibaca atau hilang saat scan dilewati, bukan error
+    try:
+        with os.scandir(path) as it:
+            entries = list(it)
+    except OSError:
+        return
+    subdirs = []
+    for entry in entries:
+        if entry.is_dir():
+            # Symlink ke folder tidak ditelusuri (followlinks=False); folder .git dipangkas saat traversal
+            if not entry.is_symlink() and entry.name != '.git':
+                subdirs.append(entry.path)
+        else:
+            # Termasuk symlink ke file, sama seperti daftar files dari os.walk
+            yield entry
+    # Urutan top-down seperti os.walk: file di folder ini dulu, baru masuk ke subfolder
+    for subdir in subdirs:
+        yield from scan_files(subdir)
 
 def analyze_local_snapshot(repo_path, output_excel="local_snapshot_report.xlsx", file_types=None):
-    import os
-    import pandas as pd
-    from tqdm import tqdm
     file_list = []
-    for root, dirs, files in os.walk(repo_path):
-        if '.git' in root:
-            continue
-        for file in files:
-            file_list.append(os.path.join(root, file))
-    data = []
-    for file_path in tqdm(file_list, desc="Snapshot HEAD", unit="file"):
-        rel_path = os.path.relpath(file_path, repo_path)
+    for entry in scan_files(repo_path):
+        rel_path = os.path.relpath(entry.path, repo_path)
         if not is_relevant_file(rel_path):
             continue
         # Filter by file_types if provided
         if file_types:
             if not any(rel_path.lower().endswith('.' + ext.strip().lower()) for ext in file_types):
                 continue
+        file_list.append((rel_path, entry))
+
+    def stat_size(entry):
         try:
-            size_mb = round(os.path.getsize(file_path) / 1024 / 1024, 2)
+            return entry.stat().st_size
         except Exception:
-            size_mb = None
-        data.append({
-            "File": rel_path,
-            "File Size (MB)": size_mb,
-            "NonStandard": is_non_standard(file_path),
-            "Validation": validate_file_size(file_path, size_mb)
-        })
-    df = pd.DataFrame(data)
+            return np.nan
+
+    # Hanya file yang lolos filter yang di-stat, paralel di thread pool
+    with ThreadPoolExecutor(max_workers=STAT_WORKERS) as executor:
+        sizes = np.fromiter(
+            tqdm(executor.map(stat_size, (entry for _, entry in file_list)),
+                 total=len(file_list), desc="Snapshot HEAD", unit="file",
+                 miniters=max(1, len(file_list) // 200), mininterval=0.5),
+            dtype=np.float64, count=len(file_list)
+        )
+    # Dibangun per kolom; konversi MB, pembulatan dan validasi sekali untuk seluruh kolom
+    # dtype object eksplisit: tanpa file yang lolos filter, kolom kosong jadi float64 dan .str gagal
+    df = pd.DataFrame({"File": pd.Series([rel_path for rel_path, _ in file_list], dtype=object)})
+    df["File Size (MB)"] = (sizes / 1048576).round(2)
     if not df.empty:
         df = df.sort_values(["File Size (MB)"], ascending=[False])
+    # Ekstensi dihitung sekali (setelah sort) dan dipakai ulang untuk semua klasifikasi
+    ext = file_extensions(df["File"])
+    df["NonStandard"] = is_non_standard_vectorized(ext)
+    df["Validation"] = validate_file_size_vectorized(ext, df["File Size (MB)"])
     # Sheet Optimization Candidates
     if not df.empty:
-        opt_df = df[(df["Validation"] == "OVERSIZE") & (~df["File"].str.lower().str.endswith(tuple([".so", ".dex", ".aar", ".apk", ".jar"])))].copy()
+        candidates = (df["Validation"] == "OVERSIZE") & ~ext.isin(BINARY_EXTS)
+        opt_df = df[candidates].copy()
         if not opt_df.empty:
-            opt_df["Saran Optimasi"] = opt_df.apply(lambda row: suggest_optimization(row["File"], row["File Size (MB)"]), axis=1)
+            opt_df["Saran Optimasi"] = suggest_optimization_vectorized(ext[candidates])
         else:
             opt_df = pd.DataFrame()
     else:
         opt_df = pd.DataFrame()
     return df, opt_df
 
-def analyze_local_all_commits(repo_path, file_patterns=None):
-    import subprocess
-    import pandas as pd
-    import re
-    from tqdm import tqdm
-    # Get all commits (not just linear)
-    log_cmd = [
-        "git", "-C", repo_path, "rev-list", "--all"
-    ]
-    result = subprocess.run(log_cmd, capture_output=True, text=True)
-    commits = result.stdout.strip().splitlines()
-    # Get commit info (date, title)
-    commit_info = {}
-    for sha in commits:
-        info_cmd = [
-            "git", "-C", repo_path, "show", "-s", "--format=%ad|%s", "--date=short", sha
-        ]
-        info_result = subprocess.run(info_cmd, capture_output=True, text=True)
-        if '|' in info_result.stdout:
-            date, title = info_result.stdout.strip().split('|', 1)
-        else:
-            date, title = '', ''
-        commit_info[sha] = (date, title)
-    data = []
-    for sha in tqdm(commits, desc="Processing all commits", unit="commit"):
-        diff_cmd = [
-            "git", "-C", repo_path, "diff-tree", "--no-commit-id", "--name-only", "-r", "-m", "--root", sha
-        ]
-        diff_result = subprocess.run(diff_cmd, capture_output=True, text=True)
-        files = diff_result.stdout.strip().splitlines()
-        for file_path in files:
-            if file_patterns and not any(re.search(p, file_path) for p in file_patterns):
-                continue
-            size_kb = get_file_size_in_commit(repo_path, sha, file_path)
-            size_mb = round(size_kb / 1024, 2) if size_kb is not None else None
-            validation = validate_file_size(file_path, size_mb)
-            date, title = commit_info.get(sha, ('', ''))
-            data.append({
-                "Commit": sha[:8],
-                "Date": date,
-                "Commit Title": title,
-                "File": file_path,
-                "File Size (MB)": size_mb,
-                "NonStandard": is_non_standard(file_path),
-                "Validation": validation
-            })
-    df = pd.DataFrame(data)
+def analyze_local_all_commits(repo_path, file_patterns=None, start_date=None, end_date=None, max_count=None):
+    # Gabung semua pattern jadi satu regex, dikompilasi sekali
+    compiled = re.compile('|'.join(f'(?:{p})' for p in file_patterns)) if file_patterns else None
+    path_filter = _make_path_filter(compiled)
+    # Semua commit (not just linear) beserta file yang berubah dan ukurannya, dari satu git log --all.
+    # Selalu lewat pipeline git log (paralel + progress bar), bukan walk pygit2 yang serial:
+    # mode ini yang historinya paling besar
+    _, changed = git_log_commit_changes(repo_path, start_date, end_date, path_filter,
+                                        revisions=["--all"], max_count=max_count)
+    cols = {"Commit": [], "Date": [], "Commit Title": [], "File": [], "File Size (MB)": []}
+    for sha, date, title, file_path, size_kb in changed:
+        cols["Commit"].append(sha[:8])
+        cols["Date"].append(date)
+        cols["Commit Title"].append(title)
+        cols["File"].append(file_path)
+        cols["File Size (MB)"].append(size_kb)
+    df = pd.DataFrame(cols) if changed else pd.DataFrame()
     if not df.empty:
+        # KB -> MB dan klasifikasi sekali untuk seluruh kolom, bukan per baris
+        df["File Size (MB)"] = (pd.to_numeric(df["File Size (MB)"], errors='coerce') / 1024).round(2)
+        ext = file_extensions(df["File"])
+        df["NonStandard"] = is_non_standard_vectorized(ext)
+        df["Validation"] = validate_file_size_vectorized(ext, df["File Size (MB)"])
         df = df.sort_values(["File Size (MB)"], ascending=[False])
     return df
 
 def get_current_branch(repo_path):
-    import subprocess
     result = subprocess.run(
         ["git", "-C", repo_path, "rev-parse", "--abbrev-ref", "HEAD"],
         capture_output=True, text=True
     )
     return result.stdout.strip()
 
+def has_uncommitted_changes(repo_path):
+    # `diff --quiet` berhenti di path pertama yang berubah, tidak scan seluruh worktree seperti `status --porcelain`
+    result = subprocess.run(["git", "-C", repo_path, "diff", "--quiet", "HEAD", "--"])
+    return result.returncode != 0
+
+def ref_exists(repo_path, ref):
+    """Cek ref menunjuk ke commit via `rev-parse --verify`, tanpa menelusuri history"""
+    result = subprocess.run(
+        ["git", "-C", repo_path, "rev-parse", "--verify", "--quiet", f"{ref}^{{commit}}"],
+        capture_output=True, text=True
+    )
+    return result.returncode == 0
+
+def checkout_branch(repo_path, branch):
+    result = subprocess.run(
+        ["git", "-C", repo_path, "checkout", branch],
+        capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        print(f"❌ Gagal checkout branch {branch}: {result.stderr.strip()}")
+        return False
+    print(f"✅ Checkout ke branch: {branch}")
+    return True
+
 def parse_args():
     parser = argparse.ArgumentParser()
     parser.add_argument('--gitlab-url', help='GitLab URL (e.g., https://gitlab.com)')
@@ -844,6 +1287,9 @@ def parse_args():
     parser.add_argument('--analyze-local-all-commits', action='store_true', help='Analyze all commits in local repo (not just linear)')
     parser.add_argument('--analyze-apk', action='store_true', help='Analyze APK/AAB file content')
     parser.add_argument('--apk-path', help='Path to APK/AAB file to analyze')
+    parser.add_argument('--clone-path', help='Path to a local clone of the GitLab project; file sizes are read with git cat-file instead of the files API')
+    parser.add_argument('--only-bounded', action='store_true', help='Local commit analysis: skip files whose extension has no size limit (they are always OK)')
+    parser.add_argument('--no-sort', action='store_true', help='Local commit analysis: keep git log order instead of sorting the report by file size')
     parser.add_argument('--snapshot-file-types', help='Filter file types (comma separated, e.g. png,jpg,webp) for snapshot HEAD')
     args = parser.parse_args()
 
@@ -856,154 +1302,65 @@ def parse_args():
     if not args.analyze_branch and not args.target_branch and not (args.analyze_local_commits or args.analyze_local_snapshot or args.analyze_local_all_commits or args.analyze_apk):
         parser.error("Either --target-branch, --analyze-branch, atau salah satu mode analisis lokal/--analyze-apk harus diisi")
 
-    # Validasi format tanggal
+    # Validasi format tanggal; hasil parse disimpan di args supaya tidak di-parse ulang
+    args.start_dt = args.end_dt = None
     if args.start_date:
         try:
-            datetime.strptime(args.start_date, '%Y-%m-%d')
+            args.start_dt = datetime.strptime(args.start_date, '%Y-%m-%d').replace(tzinfo=timezone.utc)
         except ValueError:
             parser.error("Start date must be in YYYY-MM-DD format")
     if args.end_date:
         try:
-            datetime.strptime(args.end_date, '%Y-%m-%d')
+            args.end_dt = datetime.strptime(args.end_date, '%Y-%m-%d').replace(tzinfo=timezone.utc)
         except ValueError:
             parser.error("End date must be in YYYY-MM-DD format")
     return args
 
-def main():
-    try:
-        args = parse_args()
-        # Analisis APK/AAB
-        if getattr(args, 'analyze_apk', False):
-            if not args.apk_path:
-                print("❌ Harap isi --apk-path untuk analisis APK/AAB!")
-                return
-            project_root = args.local_path if hasattr(args, 'local_path') else None
-            apk_df, mapping_df = analyze_apk_aab(args.apk_path, project_root)
-            with pd.ExcelWriter(args.output_excel, engine='openpyxl') as writer:
-                apk_df.to_excel(writer, sheet_name='APK_AAB_Content', index=False)
-                if mapping_df is not None and not mapping_df.empty:
-                    mapping_df.to_excel(writer, sheet_name='APK_to_Project_Mapping', index=False)
-            print(f"\n✅ APK/AAB content report saved to {args.output_excel}")
-            return
-        # Hybrid mode: snapshot HEAD dan/atau all commits
-        if getattr(args, 'analyze_local_snapshot', False) or getattr(args, 'analyze_local_all_commits', False):
-            info_data = []
-            from datetime import datetime
-            info_data.append(["Generated At", datetime.now().strftime("%Y-%m-%d %H:%M:%S")])
-            info_data.append(["Repo Path", args.local_path])
-            info_data.append(["Branch", get_current_branch(args.local_path)])
-            if getattr(args, 'analyze_local_snapshot', False):
-                info_data.append(["Snapshot HEAD", "Yes"])
-            if getattr(args, 'analyze_local_all_commits', False):
-                info_data.append(["All Commits", "Yes"])
-            info_data.append(["Start Date", args.start_date if args.start_date else "(tidak dispesifikasikan)"])
-            info_data.append(["End Date", args.end_date if args.end_date else "(tidak dispesifikasikan)"])
-            file_types = args.snapshot_file_types.split(',') if getattr(args, 'snapshot_file_types', None) else None
-            # Sheet: Snapshot HEAD
-            snapshot_df, opt_df = analyze_local_snapshot(args.local_path, file_types=file_types) if getattr(args, 'analyze_local_snapshot', False) else (None, None)
-            # Sheet: All Commits
-            all_commits_df = analyze_local_all_commits(args.local_path, args.file_patterns.split(',') if args.file_patterns else None) if getattr(args, 'analyze_local_all_commits', False) else None
-            # Sheet: Validation Rules
-            validation_rules = [
-                ["Kategori", "Ekstensi/Format", "Batas Maksimal (MB)", "Catatan"],
-                ["Icon/Ilustrasi Sederhana", "XML (Vector)", "0.02", "< 20 KB"],
-                ["Icon/Ilustrasi Sederhana", "PNG/JPG", "0.05", "≤ 50 KB"],
-                ["Gambar Konten", "WebP", "0.2", "≤ 200 KB"],
-                ["Gambar Fullscreen", "WebP/JPG", "0.5", "≤ 500 KB (1080x1920)"],
-                ["Audio Efek", "OGG/AAC", "0.1", "< 100 KB (<5s)"],
-                ["Audio Musik Pendek", "OGG/AAC", "0.3", "≤ 300 KB"],
-                ["Video Pendek", "MP4/MOV/M4V", "1", "< 1 MB (480p)"],
-                ["Lottie Animation", "JSON", "0.2", "50–200 KB"],
-                ["Native Library", ".so", "5", "≤ 5 MB per ABI"],
-                ["DEX/Kode", ".dex", "10", "≤ 10 MB per file"],
-                ["JSON/Data Bundling", ".json", "0.1", "≤ 100 KB"],
-                ["Font", ".ttf/.otf", "0.5", "≤ 500 KB"],
-                ["Resource XML", ".xml", "0.02", "< 20 KB"],
-            ]
-            with pd.ExcelWriter(args.output_excel, engine='openpyxl') as writer:
-                pd.DataFrame(info_data, columns=["Info", "Value"]).to_excel(writer, sheet_name='Info', index=False)
-                if snapshot_df is not None:
-                    snapshot_df.to_excel(writer, sheet_name='Snapshot HEAD', index=False)
-                if opt_df is not None and not opt_df.empty:
-                    opt_df.to_excel(writer, sheet_name='Optimization Candidates', index=False)
-                if all_commits_df is not None:
-                    all_commits_df.to_excel(writer, sheet_name='All Commits', index=False)
-                pd.DataFrame(validation_rules[1:], columns=validation_rules[0]).to_excel(writer, sheet_name='Validation Rules', index=False)
-            print(f"\n✅ Hybrid report saved to {args.output_excel}")
-            return
-        # Jalankan analisis lokal dulu, jika dipilih
-        if getattr(args, 'analyze_local_commits', False):
-            # Jika user ingin checkout branch tertentu
-            if getattr(args, 'local_branch', None):
-                if has_uncommitted_changes(args.local_path):
-                    print("❌ Repo memiliki perubahan yang belum di-commit. Silakan commit atau stash dulu sebelum melanjutkan.")
-                    return
-                if not checkout_branch(args.local_path, args.local_branch):
-                    return
-            # Tampilkan branch yang sedang aktif
-            current_branch = get_current_branch(args.local_path)
-            print(f"\n🔎 Sedang menganalisis branch: {current_branch}\n")
-            file_patterns = args.file_patterns.split(',') if args.file_patterns else None
-            start_date = args.start_date
-            end_date = args.end_date
-            output_excel = args.output_excel if hasattr(args, 'output_excel') else 'local_commit_report.xlsx'
-            analyze_local_commits(
-                args.local_path,
-                start_date=start_date,
-                end_date=end_date,
-                file_patterns=file_patterns,
-                output_excel=output_excel
-            )
-            return
-
-        # Inisialisasi GitLabAPI hanya jika mode lokal TIDAK dipilih
-        gitlab = GitLabAPI(
-            args.gitlab_url, 
-            args.token, 
-            args.project_id,
-            verify_ssl=not args.no_verify_ssl
+async def run_gitlab_analysis(args):
+    """Jalankan analisis MR/branch via GitLab API dengan satu session aiohttp"""
+    async with GitLabAPI(
+        args.gitlab_url, 
+        args.token, 
+        args.project_id,
+        verify_ssl=not args.no_verify_ssl,
+        repo_path=args.clone_path
+    ) as gitlab:
+        file_analyzer = FileAnalyzer(
+            file_patterns=args.file_patterns.split(',') if args.file_patterns else None,
+            min_size_kb=args.min_size_kb,
+            max_size_kb=args.max_size_kb
         )
+        report_generator = ReportGenerator(args.output_excel)
         
         if args.analyze_branch:
             # Check branch and commits first
             print("\n🔍 Checking branch and commits...")
-            if not gitlab.check_branch_and_commits(args.analyze_branch):
+            if not await gitlab.check_branch_and_commits(args.analyze_branch):
                 print("❌ Branch check failed. Please verify the branch name and access.")
                 return
-                
-            # Continue with existing analysis...
-            file_analyzer = FileAnalyzer(
-                file_patterns=args.file_patterns.split(',') if args.file_patterns else None,
-                min_size_kb=args.min_size_kb,
-                max_size_kb=args.max_size_kb
-            )
-            report_generator = ReportGenerator(args.output_excel)
             
             # Siapkan tanggal untuk filter
-            start_date = None
-            if args.start_date:
-                start_date = datetime.strptime(args.start_date, '%Y-%m-%d').replace(tzinfo=timezone.utc)
-                print(f"📅 Start date: {start_date.strftime('%Y-%m-%d')}")
+            start_date = args.start_dt
+            if start_date:
+                print(f"📅 Start date: {args.start_date}")
             
-            end_date = None
-            if args.end_date:
-                end_date = datetime.strptime(args.end_date, '%Y-%m-%d').replace(tzinfo=timezone.utc)
-                print(f"📅 End date: {end_date.strftime('%Y-%m-%d')}")
+            end_date = args.end_dt
+            if end_date:
+                print(f"📅 End date: {args.end_date}")
             
             # Definisikan callback untuk memproses commit
-            def process_commit(commit):
+            async def process_commit(commit):
                 # Filter berdasarkan title commit jika diinginkan
                 if args.commit_title and args.commit_title.lower() not in commit['title'].lower():
                     return
                     
-                changes = gitlab.get_commit_changes(commit['id'])
-                commit_date = datetime.fromisoformat(commit['created_at'].replace('Z', '+00:00'))
+                changes = await gitlab.get_commit_changes(commit['id'])
                 
                 total_size = sum(change.get('size_kb', 0) or 0 for change in changes)
                 print(f"\nProcessing commit {commit['id'][:8]} | "
                       f"files: {len(changes)} | "
                       f"size: {total_size:.2f}KB | "
-                      f"date: {commit_date.strftime('%Y-%m-%d')}")
+                      f"date: {commit['created_at'][:10]}")
                 
                 for change in changes:
                     file_path = change.get("new_path", "unknown")
@@ -1012,15 +1369,14 @@ def main():
                     report_generator.add_data(
                         commit['title'],
                         commit['id'][:8],
-                        f"commit ({commit_date.strftime('%Y-%m-%d')})",
+                        f"commit ({commit['created_at'][:10]})",
                         file_path,
-                        file_size,
-                        is_non_standard(file_path)
+                        file_size
                     )
             
             # Mulai proses commit
             print("\n📦 Starting commit analysis...")
-            gitlab.get_commits_by_branch(
+            await gitlab.get_commits_by_branch(
                 args.analyze_branch, 
                 None,  # Tidak perlu branch_creation_date
                 limit=args.limit_commits,
@@ -1033,7 +1389,7 @@ def main():
         else:
             # Existing MR analysis code
             states = args.mr_state.split(',')
-            mrs = gitlab.get_merge_requests(
+            mrs = await gitlab.get_merge_requests(
                 args.target_branch, 
                 states,
                 commit_message=args.commit_message
@@ -1043,124 +1399,201 @@ def main():
                 print("⚠️ No Merge Requests found.")
                 return
             
-            with tqdm(mrs, desc="📦 Processing", unit="mr", position=0, leave=True,
+            with tqdm(total=len(mrs), desc="📦 Processing", unit="mr", position=0, leave=True,
+                     miniters=max(1, len(mrs) // 200), mininterval=0.5,
                      bar_format='{l_bar}{bar}| {n_fmt}/{total_fmt} [{elapsed}<{remaining}]') as pbar:
-                for mr in pbar:
-                    changes = gitlab.get_mr_changes(mr['iid'])
-                    pbar.set_postfix_str(f"mr: #{mr['iid']} | files: {len(changes)}")
+                async def process_mr(mr):
+                    changes = await gitlab.get_mr_changes(mr['iid'])
+                    # refresh=False: tampilan di-refresh oleh update() sesuai miniters/mininterval
+                    pbar.set_postfix_str(f"mr: #{mr['iid']} | files: {len(changes)}", refresh=False)
+                    pbar.update(1)
                     
                     for change in changes:
                         file_path = change.get("new_path", "unknown")
-                        file_size = file_analyzer.get_file_size(file_path)
+                        # size_kb sudah diisi get_mr_changes (dari clone lokal atau header X-Gitlab-Size)
+                        file_size = file_analyzer.filter_size(file_path, change.get('size_kb'))
                         report_generator.add_data(
                             mr['title'],
                             mr['iid'],
                             mr['state'],
                             file_path,
-                            file_size,
-                            is_non_standard(file_path)
+                            file_size
                         )
+                
+                # Changes semua MR diambil secara paralel
+                await asyncio.gather(*(process_mr(mr) for mr in mrs))
+    
+    # Generate report
+    with tqdm(total=2, desc="📊 Generating", position=0, leave=True,
+             bar_format='{l_bar}{bar}| {n_fmt}/{total_fmt} [{elapsed}<{remaining}]') as pbar:
+        df = report_generator.generate_excel()
+        pbar.update(1)
+        pbar.set_postfix_str("excel")
         
-        # Generate report
-        with tqdm(total=2, desc="📊 Generating", position=0, leave=True,
-                 bar_format='{l_bar}{bar}| {n_fmt}/{total_fmt} [{elapsed}<{remaining}]') as pbar:
-            df = report_generator.generate_excel()
+        # Generate plots if not disabled
+        if not args.no_plot:
+            report_generator.generate_plots(df)
             pbar.update(1)
-            pbar.set_postfix_str("excel")
-            
-            # Generate plots if not disabled
-            if not args.no_plot:
-                report_generator.generate_plots(df)
-                pbar.update(1)
-                pbar.set_postfix_str("plots")
-        
-        # Print error summary at the end
-        gitlab.error_collector.print_errors()
-        file_analyzer.error_collector.print_errors()
-        report_generator.error_collector.print_errors()
-        
-        print("✅ Analysis completed!")
+            pbar.set_postfix_str("plots")
+    
+    # Print error summary at the end
+    gitlab.error_collector.print_errors()
+    file_analyzer.error_collector.print_errors()
+    report_generator.error_collector.print_errors()
+    
+    print("✅ Analysis completed!")
+
+def main():
+    try:
+        args = parse_args()
+        # Analisis APK/AAB
+        if getattr(args, 'analyze_apk', False):
+            if not args.apk_path:
+                print("❌ Harap isi --apk-path untuk analisis APK/AAB!")
+                return
+            project_root = args.local_path if hasattr(args, 'local_path') else None
+            apk_df, mapping_df = analyze_apk_aab(args.apk_path, project_root)
+            with pd.ExcelWriter(args.output_excel, engine='xlsxwriter') as writer:
+                apk_df.to_excel(writer, sheet_name='APK_AAB_Content', index=False)
+                if mapping_df is not None and not mapping_df.empty:
+                    mapping_df.to_excel(writer, sheet_name='APK_to_Project_Mapping', index=False)
+            print(f"\n✅ APK/AAB content report saved to {args.output_excel}")
+            return
+        # Hybrid mode: snapshot HEAD dan/atau all commits
+        if getattr(args, 'analyze_local_snapshot', False) or getattr(args, 'analyze_local_all_commits', False):
+            info_data = []
+            info_data.append(["Generated At", datetime.now().strftime("%Y-%m-%d %H:%M:%S")])
+            info_data.append(["Repo Path", args.local_path])
+            info_data.append(["Branch", get_current_branch(args.local_path)])
+            if getattr(args, 'analyze_local_snapshot', False):
+                info_data.append(["Snapshot HEAD", "Yes"])
+            if getattr(args, 'analyze_local_all_commits', False):
+                info_data.append(["All Commits", "Yes"])
+            info_data.append(["Start Date", args.start_date if args.start_date else "(tidak dispesifikasikan)"])
+            info_data.append(["End Date", args.end_date if args.end_date else "(tidak dispesifikasikan)"])
+            file_types = args.snapshot_file_types.split(',') if getattr(args, 'snapshot_file_types', None) else None
+            # Sheet: Snapshot HEAD
+            snapshot_df, opt_df = analyze_local_snapshot(args.local_path, file_types=file_types) if getattr(args, 'analyze_local_snapshot', False) else (None, None)
+            # Sheet: All Commits
+            all_commits_df = analyze_local_all_commits(
+                args.local_path,
+                args.file_patterns.split(',') if args.file_patterns else None,
+                start_date=args.start_date,
+                end_date=args.end_date,
+                max_count=args.limit_commits
+            ) if getattr(args, 'analyze_local_all_commits', False) else None
+            with pd.ExcelWriter(args.output_excel, engine='xlsxwriter') as writer:
+                pd.DataFrame(info_data, columns=["Info", "Value"]).to_excel(writer, sheet_name='Info', index=False)
+                if snapshot_df is not None:
+                    snapshot_df.to_excel(writer, sheet_name='Snapshot HEAD', index=False)
+                if opt_df is not None and not opt_df.empty:
+                    opt_df.to_excel(writer, sheet_name='Optimization Candidates', index=False)
+                if all_commits_df is not None:
+                    all_commits_df.to_excel(writer, sheet_name='All Commits', index=False)
+                VALIDATION_RULES_DF.to_excel(writer, sheet_name='Validation Rules', index=False)
+            print(f"\n✅ Hybrid report saved to {args.output_excel}")
+            return
+        # Jalankan analisis lokal dulu, jika dipilih
+        if getattr(args, 'analyze_local_commits', False):
+            # Jika user ingin checkout branch tertentu
+            if getattr(args, 'local_branch', None):
+                if has_uncommitted_changes(args.local_path):
+                    print("❌ Repo memiliki perubahan yang belum di-commit. Silakan commit atau stash dulu sebelum melanjutkan.")
+                    return
+                # checkout juga bisa membuat branch lokal dari origin/<branch>
+                if not (ref_exists(args.local_path, args.local_branch)
+                        or ref_exists(args.local_path, f"origin/{args.local_branch}")):
+                    print(f"❌ Branch {args.local_branch} tidak ditemukan di {args.local_path}")
+                    return
+                if not checkout_branch(args.local_path, args.local_branch):
+                    return
+            # Tampilkan branch yang sedang aktif
+            current_branch = get_current_branch(args.local_path)
+            print(f"\n🔎 Sedang menganalisis branch: {current_branch}\n")
+            file_patterns = args.file_patterns.split(',') if args.file_patterns else None
+            start_date = args.start_date
+            end_date = args.end_date
+            output_excel = args.output_excel if hasattr(args, 'output_excel') else 'local_commit_report.xlsx'
+            analyze_local_commits(
+                args.local_path,
+                start_date=start_date,
+                end_date=end_date,
+                file_patterns=file_patterns,
+                output_excel=output_excel,
+                only_bounded=args.only_bounded,
+                sort=not args.no_sort,
+                max_count=args.limit_commits
+            )
+            return
+
+        # Inisialisasi GitLabAPI hanya jika mode lokal TIDAK dipilih
+        asyncio.run(run_gitlab_analysis(args))
         
     except KeyboardInterrupt:
-        print(f"\n{Fore.YELLOW}⚠️ Proses dibatalkan oleh user{Style.RESET_ALL}")
-        print(f"{Fore.YELLOW}ℹ️ Data yang sudah diproses akan disimpan{Style.RESET_ALL}")
+        print(CANCELLED_MESSAGE)
+        print(DATA_SAVED_MESSAGE)
         sys.exit(0)
     except Exception as e:
-        print(f"\n{Fore.RED}❌ Error: {str(e)}{Style.RESET_ALL}")
+        print(f"\n{RED}❌ Error: {str(e)}{RESET}")
         sys.exit(1)
 
-def analyze_local_commits(repo_path, start_date=None, end_date=None, file_patterns=None, output_excel="local_commit_report.xlsx"):
-    import subprocess
-    import pandas as pd
-    import re
-    from datetime import datetime
-    from tqdm import tqdm
-    # Get list of commits in date range
-    log_cmd = [
-        "git", "-C", repo_path, "log", "--pretty=format:%H|%ad|%s", "--date=short"
-    ]
-    if start_date:
-        log_cmd.append(f"--since={start_date}")
-    if end_date:
-        log_cmd.append(f"--until={end_date}")
-    commits = []
-    result = subprocess.run(log_cmd, capture_output=True, text=True)
-    for line in result.stdout.strip().splitlines():
-        if '|' in line:
-            parts = line.split('|', 2)
-            if len(parts) == 3:
-                sha, date, title = parts
-                commits.append((sha.strip(), date.strip(), title.strip()))
-            else:
-                sha, date = parts[0], parts[1]
-                commits.append((sha.strip(), date.strip(), ""))
-    print(f"\n🔍 Found {len(commits)} commits in range.")
-    data = []
-    for sha, date, title in tqdm(commits, desc="Processing commits", unit="commit"):
-        diff_cmd = [
-            "git", "-C", repo_path, "diff-tree", "--no-commit-id", "--name-only", "-r", "-m", "--root", sha
-        ]
-        diff_result = subprocess.run(diff_cmd, capture_output=True, text=True)
-        files = diff_result.stdout.strip().splitlines()
-        for file_path in files:
-            if file_patterns and not any(re.search(p, file_path) for p in file_patterns):
-                continue
-            size_kb = get_file_size_in_commit(repo_path, sha, file_path)
-            size_mb = round(size_kb / 1024, 2) if size_kb is not None else None
-            validation = validate_file_size(file_path, size_mb)
-            data.append({
-                "Commit": sha[:8],
-                "Date": date,
-                "Commit Title": title,
-                "File": file_path,
-                "File Size (MB)": size_mb,
-                "NonStandard": is_non_standard(file_path),
-                "Validation": validation
-            })
-    df = pd.DataFrame(data)
+def analyze_local_commits(repo_path, start_date=None, end_date=None, file_patterns=None, output_excel="local_commit_report.xlsx",
+                          only_bounded=False, sort=True, max_count=None):
+    # Gabung semua pattern jadi satu regex, dikompilasi sekali
+    compiled = re.compile('|'.join(f'(?:{p})' for p in file_patterns)) if file_patterns else None
+    path_filter = _make_path_filter(compiled, only_bounded)
+    if pygit2 is not None:
+        # Pakai libgit2 in-process jika tersedia
+        commit_count, changed = pygit2_commit_changes(repo_path, start_date, end_date, path_filter, max_count=max_count)
+    else:
+        commit_count, changed = git_log_commit_changes(repo_path, start_date, end_date, path_filter, max_count=max_count)
+    print(f"\n🔍 Found {commit_count} commits in range.")
+    # Simpan per kolom (list per kolom), DataFrame dibangun sekali di akhir
+    cols = {"Commit": [], "Date": [], "Commit Title": [], "File": [], "File Size (MB)": []}
+    # Ukuran disimpan mentah (KB), konversi ke MB + pembulatan dilakukan sekali untuk satu kolom
+    for sha, date, title, file_path, size_kb in changed:
+        cols["Commit"].append(sha[:8])
+        cols["Date"].append(date)
+        cols["Commit Title"].append(title)
+        cols["File"].append(file_path)
+        cols["File Size (MB)"].append(size_kb)
+    df = pd.DataFrame(cols) if changed else pd.DataFrame()
     if not df.empty:
+        # None -> NaN, lalu KB -> MB dibulatkan 2 desimal secara vectorized
+        df["File Size (MB)"] = (pd.to_numeric(df["File Size (MB)"], errors='coerce') / 1024).round(2)
+        # Klasifikasi sekaligus untuk seluruh kolom, ekstensi cukup dihitung sekali
+        ext = file_extensions(df["File"])
+        df["NonStandard"] = is_non_standard_vectorized(ext)
+        df["Validation"] = validate_file_size_vectorized(ext, df["File Size (MB)"])
+    # --no-sort: urutan tetap sesuai git log, user bisa sort sendiri di Excel
+    if sort and not df.empty:
         df = df.sort_values(["File Size (MB)"], ascending=[False])
     # Grouping by File
     if not df.empty:
-        grouped = df.groupby("File").agg({
-            "File Size (MB)": "max",
-            "Commit": "count",
-            "Date": "max",
-            "Validation": lambda x: "OVERSIZE" if (x == "OVERSIZE").any() else "OK",
-            "Commit Title": "last",
-            "NonStandard": "first"
-        }).reset_index()
-        grouped = grouped.rename(columns={
-            "Commit": "Change Count",
-            "Date": "Last Change Date"
-        })
+        # Hanya agregasi bawaan pandas (tanpa lambda per grup); OVERSIZE jika ada satu commit yang OVERSIZE
+        grouped = (
+            df.assign(_oversize=df["Validation"].eq("OVERSIZE"))
+            .groupby("File")
+            .agg(**{
+                "File Size (MB)": ("File Size (MB)", "max"),
+                "Change Count": ("Commit", "count"),
+                "Last Change Date": ("Date", "max"),
+                "Validation": ("_oversize", "any"),
+                "Commit Title": ("Commit Title", "last"),
+                "NonStandard": ("NonStandard", "first"),
+            })
+            .reset_index()
+        )
+        grouped["Validation"] = np.where(grouped["Validation"], "OVERSIZE", "OK")
     else:
         grouped = pd.DataFrame()
     # Summary info
     total_size = df["File Size (MB)"].sum() if not df.empty else 0
     total_files = len(df)
     total_oversize = (df["Validation"] == "OVERSIZE").sum() if not df.empty else 0
-    biggest_file = df.iloc[0] if not df.empty else None
+    # Tanpa sort, file terbesar dicari dengan nlargest (O(N)), bukan dari baris pertama
+    biggest = df.nlargest(1, "File Size (MB)") if not df.empty else df
+    biggest_file = biggest.iloc[0] if not biggest.empty else None
     info_data = [
         ["Branch", get_current_branch(repo_path)],
         ["Start Date", start_date if start_date else "(tidak dispesifikasikan)"],
@@ -1175,94 +1608,46 @@ def analyze_local_commits(repo_path, start_date=None, end_date=None, file_patter
             ["Biggest File Size (MB)", biggest_file["File Size (MB)"]],
         ]
     # Tulis ke Excel dengan sheet info di tab pertama, lalu report, lalu aturan validasi
-    validation_rules = [
-        ["Kategori", "Ekstensi/Format", "Batas Maksimal (MB)", "Catatan"],
-        ["Icon/Ilustrasi Sederhana", "XML (Vector)", "0.02", "< 20 KB"],
-        ["Icon/Ilustrasi Sederhana", "PNG/JPG", "0.05", "≤ 50 KB"],
-        ["Gambar Konten", "WebP", "0.2", "≤ 200 KB"],
-        ["Gambar Fullscreen", "WebP/JPG", "0.5", "≤ 500 KB (1080x1920)"],
-        ["Audio Efek", "OGG/AAC", "0.1", "< 100 KB (<5s)"],
-        ["Audio Musik Pendek", "OGG/AAC", "0.3", "≤ 300 KB"],
-        ["Video Pendek", "MP4/MOV/M4V", "1", "< 1 MB (480p)"],
-        ["Lottie Animation", "JSON", "0.2", "50–200 KB"],
-        ["Native Library", ".so", "5", "≤ 5 MB per ABI"],
-        ["DEX/Kode", ".dex", "10", "≤ 10 MB per file"],
-        ["JSON/Data Bundling", ".json", "0.1", "≤ 100 KB"],
-        ["Font", ".ttf/.otf", "0.5", "≤ 500 KB"],
-        ["Resource XML", ".xml", "0.02", "< 20 KB"],
-    ]
-    with pd.ExcelWriter(output_excel, engine='openpyxl') as writer:
+    with pd.ExcelWriter(output_excel, engine='xlsxwriter') as writer:
         pd.DataFrame(info_data, columns=["Info", "Value"]).to_excel(writer, sheet_name='Info', index=False)
         df.to_excel(writer, sheet_name='File Report', index=False)
         grouped.to_excel(writer, sheet_name='Grouped Files', index=False)
-        pd.DataFrame(validation_rules[1:], columns=validation_rules[0]).to_excel(writer, sheet_name='Validation Rules', index=False)
-    # Conditional formatting: warna merah untuk OVERSIZE
-    try:
-        from openpyxl.styles import PatternFill
-        from openpyxl import load_workbook
-        wb = load_workbook(output_excel)
-        ws = wb['File Report']
-        val_col = None
-        for idx, cell in enumerate(ws[1], 1):
-            if cell.value == "Validation":
-                val_col = idx
-                break
-        if val_col:
-            red_fill = PatternFill(start_color="FF0000", end_color="FF0000", fill_type="solid")
-            for row in ws.iter_rows(min_row=2, min_col=val_col, max_col=val_col):
-                for cell in row:
-                    if cell.value == "OVERSIZE":
-                        cell.fill = red_fill
-            wb.save(output_excel)
-    except Exception as e:
-        print(f"Warning: Conditional formatting failed: {e}")
+        VALIDATION_RULES_DF.to_excel(writer, sheet_name='Validation Rules', index=False)
+        # Conditional formatting: warna merah untuk OVERSIZE, langsung saat menulis (tanpa buka ulang file)
+        if not df.empty:
+            val_col = df.columns.get_loc("Validation")
+            red_fill = writer.book.add_format({'bg_color': '#FF0000'})
+            writer.sheets['File Report'].conditional_format(1, val_col, len(df), val_col, {
+                'type': 'text', 'criteria': 'containing', 'value': 'OVERSIZE', 'format': red_fill
+            })
     print(f"\n✅ Local commit file size report saved to {output_excel}")
     return df
 
 def map_apk_to_project(apk_files, project_root):
-    import os
-    project_files = []
-    for root, dirs, files in os.walk(project_root):
-        for file in files:
-            project_files.append(os.path.relpath(os.path.join(root, file), project_root))
+    # Index basename -> path project pertama yang ditemukan (urutan traversal), lookup O(1) per file APK
+    project_index = {}
+    for entry in scan_files(project_root):
+        project_index.setdefault(entry.name, os.path.relpath(entry.path, project_root))
     mapping = []
     for apk_file, size_mb, saran in apk_files:
-        matches = [f for f in project_files if os.path.basename(f) == os.path.basename(apk_file)]
         mapping.append({
             'File in APK': apk_file,
             'Size (MB)': size_mb,
-            'Project File': matches[0] if matches else '',
+            'Project File': project_index.get(os.path.basename(apk_file), ''),
             'Saran Optimasi': saran
         })
     return mapping
 
-def safe_rmtree(path, retries=3):
-    for i in range(retries):
-        try:
-            shutil.rmtree(path)
-            return
-        except Exception as e:
-            print(f"Retrying delete {path} ({i+1}/{retries})... {e}")
-            time.sleep(1)
-    raise
-
 def analyze_apk_aab(apk_path, project_root=None):
-    import os
-    import pandas as pd
-    from tqdm import tqdm
-    extract_dir = apk_path + "_extract"
-    if os.path.exists(extract_dir):
-        safe_rmtree(extract_dir)
-    with zipfile.ZipFile(apk_path, 'r') as zip_ref:
-        zip_ref.extractall(extract_dir)
     data = []
-    for root, dirs, files in os.walk(extract_dir):
-        for file in files:
-            file_path = os.path.join(root, file)
-            rel_path = os.path.relpath(file_path, extract_dir)
-            size_mb = round(os.path.getsize(file_path) / 1024 / 1024, 2)
-            saran = suggest_optimization(rel_path, size_mb)
-            data.append((rel_path, size_mb, saran))
+    # Ukuran dibaca dari central directory zip, tanpa extract ke disk
+    with zipfile.ZipFile(apk_path, 'r') as zip_ref:
+        for info in zip_ref.infolist():
+            if info.is_dir():
+                continue
+            size_mb = round(info.file_size / 1024 / 1024, 2)
+            saran = suggest_optimization(info.filename, size_mb)
+            data.append((info.filename, size_mb, saran))
     df = pd.DataFrame([{'File in APK/AAB': d[0], 'Size (MB)': d[1], 'Saran Optimasi': d[2]} for d in data])
     if not df.empty:
         df = df.sort_values(["Size (MB)"], ascending=[False])